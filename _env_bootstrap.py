@@ -0,0 +1,11 @@
+"""
+Loads .env.local into the process environment.
+
+Import this module instead of calling load_dotenv() at import time; Python
+runs a module once per process, so the file is parsed a single time however
+many modules import it.
+"""
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=".env.local", override=False)
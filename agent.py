@@ -1,6 +1,5 @@
 import logging
 
-from dotenv import load_dotenv
 from livekit.agents import (
     Agent,
     AgentSession,
@@ -21,8 +20,8 @@ from livekit.plugins import (
 )
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+import _env_bootstrap  # noqa: F401  loads .env.local
 
-load_dotenv(dotenv_path=".env.local")
 logger = logging.getLogger("voice-agent")
 
 
@@ -3,13 +3,17 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_restx import Api
 from flask_cors import CORS
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
 from config import Config
+from app.representations import OrjsonProvider, output_json
+from app import cache
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 migrate = Migrate()
 
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(Config)
     
     # Enable CORS for all domains on all routes
@@ -17,13 +21,28 @@ def create_app():
     
     db.init_app(app)
     migrate.init_app(app, db)
+    cache.init_app(app)
     
     # Initialize Flask-RESTX
-    api = Api(app, 
-              version='1.0', 
+    enable_swagger = app.config['ENABLE_SWAGGER']
+    api = Api(version='1.0', 
               title='Interview Co-Pilot API',
               description='API for managing interview projects and resumes',
-              doc='/swagger/')
+              doc='/swagger/' if enable_swagger else False)
+    # add_specs is only honoured by init_app, not the constructor
+    api.init_app(app, add_specs=enable_swagger)
+    api.representation('application/json')(output_json)
+    
+    @api.errorhandler(OperationalError)
+    def handle_database_unavailable(error):
+        """Ask clients to retry when the database connection drops mid-request"""
+        db.session.rollback()
+        return {'message': 'Database temporarily unavailable'}, 503, {'Retry-After': '1'}
+    
+    @api.errorhandler(PoolTimeoutError)
+    def handle_pool_exhausted(error):
+        """Ask clients to retry when no pooled connection frees up within pool_timeout"""
+        return {'message': 'Database busy'}, 503, {'Retry-After': '1'}
     
     # Import models to ensure they are registered with SQLAlchemy
     from app import models
@@ -0,0 +1,192 @@
+import logging
+import threading
+from uuid import UUID
+import orjson
+import redis
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response may be served before it is rebuilt from the database
+CACHE_TTL = 60
+
+# /resumes/<id>/full embeds language names, which are not invalidated per resume
+RESUME_FULL_TTL = 30
+
+# Namespaces that cache their by-resume lists; all are cleared when a resume is deleted
+RESUME_LIST_NAMESPACES = ('certificates', 'domains', 'education')
+
+# In-process cache of single-row GET responses, keyed by (namespace, id).
+# Each worker holds its own copy, so another worker's writes can leave an
+# entry stale for up to DETAIL_CACHE_TTL seconds.
+DETAIL_CACHE_SIZE = 10_000
+DETAIL_CACHE_TTL = 30
+
+# In-process cache of language list pages, keyed by request path and query
+# string. Languages are a small reference table that rarely changes, so
+# pages are kept longer; other workers may lag a write by up to this TTL.
+LANGUAGE_LIST_TTL = 300
+
+_client = None
+_detail_cache = TTLCache(maxsize=DETAIL_CACHE_SIZE, ttl=DETAIL_CACHE_TTL)
+_detail_lock = threading.Lock()
+_language_list_cache = TTLCache(maxsize=64, ttl=LANGUAGE_LIST_TTL)
+_language_list_lock = threading.Lock()
+
+
+def init_app(app):
+    """Connect to Redis at REDIS_URL; caching is disabled when it is not set"""
+    global _client
+    url = app.config.get('REDIS_URL')
+    # The client keeps one connection pool that all threads in the worker share
+    _client = redis.Redis.from_url(url) if url else None
+
+
+def cache_get(key):
+    """Return the decoded value stored at key, or None on a miss or Redis error"""
+    if _client is None:
+        return None
+    try:
+        value = _client.get(key)
+    except redis.RedisError:
+        logger.warning('Redis unavailable, skipping cache read for %s', key, exc_info=True)
+        return None
+    return orjson.loads(value) if value is not None else None
+
+
+def cache_set(key, value, ttl=CACHE_TTL):
+    """Store value at key for ttl seconds; Redis errors are logged and ignored"""
+    if _client is None:
+        return
+    try:
+        _client.setex(key, ttl, orjson.dumps(value))
+    except redis.RedisError:
+        logger.warning('Redis unavailable, skipping cache write for %s', key, exc_info=True)
+
+
+def cache_get_bytes(key):
+    """Return the raw bytes stored at key, or None on a miss or Redis error"""
+    if _client is None:
+        return None
+    try:
+        return _client.get(key)
+    except redis.RedisError:
+        logger.warning('Redis unavailable, skipping cache read for %s', key, exc_info=True)
+        return None
+
+
+def cache_set_bytes(key, value, ttl=CACHE_TTL):
+    """Store an already encoded body at key for ttl seconds; Redis errors are logged and ignored"""
+    if _client is None:
+        return
+    try:
+        _client.setex(key, ttl, value)
+    except redis.RedisError:
+        logger.warning('Redis unavailable, skipping cache write for %s', key, exc_info=True)
+
+
+def list_version_key(namespace):
+    """Key of the counter bumped on every write to a namespace's rows"""
+    return f'{namespace}:version'
+
+
+def list_version(namespace):
+    """Return a namespace's write counter, or None when Redis is not available to hold it"""
+    if _client is None:
+        return None
+    try:
+        value = _client.get(list_version_key(namespace))
+    except redis.RedisError:
+        logger.warning('Redis unavailable, skipping list version read for %s', namespace, exc_info=True)
+        return None
+    return int(value or 0)
+
+
+def _invalidate(keys, namespaces=()):
+    """Delete keys and bump the namespaces' list versions in one round trip; Redis errors are logged and ignored"""
+    if _client is None or not (keys or namespaces):
+        return
+    pipe = _client.pipeline(transaction=False)
+    if keys:
+        pipe.delete(*keys)
+    for namespace in namespaces:
+        pipe.incr(list_version_key(namespace))
+    try:
+        pipe.execute()
+    except redis.RedisError:
+        logger.warning('Redis unavailable, could not invalidate %s', keys, exc_info=True)
+
+
+def cache_delete(*keys):
+    """Invalidate keys; Redis errors are logged and ignored"""
+    if _client is None or not keys:
+        return
+    try:
+        _client.delete(*keys)
+    except redis.RedisError:
+        logger.warning('Redis unavailable, could not invalidate %s', keys, exc_info=True)
+
+
+def resume_list_key(namespace, resume_id):
+    """Key for a namespace's cached by-resume list; resume_id may be a UUID or any string form of one"""
+    return f'{namespace}:{UUID(str(resume_id))}'
+
+
+def language_list_get(key):
+    """Return the cached (items, headers) for a language list page, or None"""
+    with _language_list_lock:
+        return _language_list_cache.get(key)
+
+
+def language_list_set(key, entry):
+    """Cache the (items, headers) served for a language list page"""
+    with _language_list_lock:
+        _language_list_cache[key] = entry
+
+
+def language_list_clear():
+    """Drop every cached language list page after a language is written"""
+    with _language_list_lock:
+        _language_list_cache.clear()
+
+
+def resume_full_key(resume_id):
+    """Key for the cached /resumes/<id>/full document"""
+    return f'resumes:full:{UUID(str(resume_id))}'
+
+
+def invalidate_resume_children(namespace, *resume_ids):
+    """Drop what a write to namespace rows of resume_ids makes stale: by-resume lists, /full documents and list ETags"""
+    keys = {resume_full_key(resume_id) for resume_id in resume_ids}
+    namespaces = ()
+    if namespace in RESUME_LIST_NAMESPACES:
+        keys.update(resume_list_key(namespace, resume_id) for resume_id in resume_ids)
+        namespaces = (namespace,)
+    _invalidate(keys, namespaces)
+
+
+def invalidate_resume(resume_id):
+    """Drop every cached document for resume_id, and the detail cache its cascade may have emptied"""
+    _invalidate([resume_full_key(resume_id),
+                 *(resume_list_key(namespace, resume_id) for namespace in RESUME_LIST_NAMESPACES)],
+                RESUME_LIST_NAMESPACES)
+    with _detail_lock:
+        _detail_cache.clear()
+
+
+def detail_get(namespace, id_):
+    """Return the cached (etag, body) for a single row, or None"""
+    with _detail_lock:
+        return _detail_cache.get((namespace, id_))
+
+
+def detail_set(namespace, id_, entry):
+    """Cache the (etag, body) served for a single row"""
+    with _detail_lock:
+        _detail_cache[(namespace, id_)] = entry
+
+
+def detail_delete(namespace, id_):
+    """Drop a single row's cached response"""
+    with _detail_lock:
+        _detail_cache.pop((namespace, id_), None)
@@ -1,34 +1,40 @@
 from app import db
-from datetime import datetime
-import uuid
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+# Naive UTC timestamp filled in by the database, the server-side equivalent of datetime.utcnow
+UTC_NOW = text("timezone('utc', now())")
 
 class Resume(db.Model):
     __tablename__ = 'resume'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     first_name = db.Column(db.String(100), nullable=False)
     last_name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(255))
     phone = db.Column(db.String(20))
     summary = db.Column(db.Text)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
     
     # Relationships
-    educations = db.relationship('Education', backref='resume', lazy=True, cascade='all, delete-orphan')
-    certificates = db.relationship('Certificate', backref='resume', lazy=True, cascade='all, delete-orphan')
-    languages = db.relationship('LanguageSkill', backref='resume', lazy=True, cascade='all, delete-orphan')
-    domains = db.relationship('Domain', backref='resume', lazy=True, cascade='all, delete-orphan')
-    projects = db.relationship('Project', backref='resume', lazy=True, cascade='all, delete-orphan')
-    professional_skills = db.relationship('ProfessionalSkill', backref='resume', lazy=True, cascade='all, delete-orphan')
+    educations = db.relationship('Education', backref='resume', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
+    certificates = db.relationship('Certificate', backref='resume', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
+    languages = db.relationship('LanguageSkill', backref='resume', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
+    domains = db.relationship('Domain', backref='resume', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
+    projects = db.relationship('Project', backref='resume', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
+    professional_skills = db.relationship('ProfessionalSkill', backref='resume', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
 
 class Education(db.Model):
     __tablename__ = 'education'
+    __table_args__ = (
+        db.Index('ix_education_resume_id_id', 'resume_id', 'id'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = db.Column(db.String(36), db.ForeignKey('resume.id'), nullable=False)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    resume_id = db.Column(UUID(as_uuid=True), db.ForeignKey('resume.id', ondelete='CASCADE'), nullable=False)
     school = db.Column(db.String(200), nullable=False)
     degree = db.Column(db.String(100), nullable=False)
     major = db.Column(db.String(100), nullable=False)
@@ -36,16 +42,19 @@ class Education(db.Model):
     end = db.Column(db.DateTime)
     grade = db.Column(db.String(20))
     complete_degree = db.Column(db.Boolean, default=True)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
 
 class Certificate(db.Model):
     __tablename__ = 'certificates'
+    __table_args__ = (
+        db.Index('ix_certificates_resume_id_id', 'resume_id', 'id'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = db.Column(db.String(36), db.ForeignKey('resume.id'), nullable=False)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    resume_id = db.Column(UUID(as_uuid=True), db.ForeignKey('resume.id', ondelete='CASCADE'), nullable=False)
     certificate = db.Column(db.String(200), nullable=False)
     certificate_authority = db.Column(db.String(200))
     not_expired = db.Column(db.Boolean, default=True)
@@ -75,53 +84,63 @@ class Certificate(db.Model):
     tech_type = db.Column(db.String(100))
     reject_reason = db.Column(db.String(500))
     is_not_has_license_number = db.Column(db.Boolean, default=False)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
 
 class Language(db.Model):
     __tablename__ = 'languages'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
     name = db.Column(db.String(100), nullable=False)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
 
 class LanguageSkill(db.Model):
     __tablename__ = 'language_skills'
+    __table_args__ = (
+        db.Index('ix_language_skills_resume_id_id', 'resume_id', 'id'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = db.Column(db.String(36), db.ForeignKey('resume.id'), nullable=False)
-    language_id = db.Column(db.String(36), db.ForeignKey('languages.id'), nullable=False)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    resume_id = db.Column(UUID(as_uuid=True), db.ForeignKey('resume.id', ondelete='CASCADE'), nullable=False)
+    language_id = db.Column(UUID(as_uuid=True), db.ForeignKey('languages.id'), nullable=False)
     proficiency = db.Column(db.Integer, default=0)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
     
-    language = db.relationship('Language', backref='skills')
+    language = db.relationship('Language', backref='skills', lazy='selectin')
 
 class Domain(db.Model):
     __tablename__ = 'domains'
+    __table_args__ = (
+        db.Index('ix_domains_resume_id_id', 'resume_id', 'id'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = db.Column(db.String(36), db.ForeignKey('resume.id'), nullable=False)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    resume_id = db.Column(UUID(as_uuid=True), db.ForeignKey('resume.id', ondelete='CASCADE'), nullable=False)
     name = db.Column(db.String(200), nullable=False)
     year = db.Column(db.Integer, default=0)
     month = db.Column(db.Integer, default=0)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
 
 class Project(db.Model):
     __tablename__ = 'projects'
+    __table_args__ = (
+        db.Index('ix_projects_resume_id_id', 'resume_id', 'id'),
+        db.Index('ix_projects_technology', 'technology', postgresql_using='gin'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = db.Column(db.String(36), db.ForeignKey('resume.id'), nullable=False)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    resume_id = db.Column(UUID(as_uuid=True), db.ForeignKey('resume.id', ondelete='CASCADE'), nullable=False)
     resume_project_id = db.Column(db.String(36))
     project_id = db.Column(db.String(36))
     name = db.Column(db.String(200), nullable=False)
@@ -137,7 +156,7 @@ class Project(db.Model):
     type = db.Column(db.String(50))
     team_size = db.Column(db.Integer, default=0)
     search_skill = db.Column(db.Integer, default=0)
-    technology = db.Column(db.JSON)
+    technology = db.Column(JSONB)
     project_description = db.Column(db.Text)
     groupname = db.Column(db.String(200))
     status = db.Column(db.String(50))
@@ -155,23 +174,27 @@ class Project(db.Model):
     skill = db.Column(db.String(200))
     skill_code = db.Column(db.String(100))
     seniority = db.Column(db.String(100))
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
 
 class ProfessionalSkill(db.Model):
     __tablename__ = 'professional_skills'
+    __table_args__ = (
+        db.Index('ix_professional_skills_resume_id_id', 'resume_id', 'id'),
+        db.Index('ix_professional_skills_project_info', 'project_info', postgresql_using='gin'),
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = db.Column(db.String(36), db.ForeignKey('resume.id'), nullable=False)
+    id = db.Column(UUID(as_uuid=True), primary_key=True, server_default=text('gen_random_uuid()'))
+    resume_id = db.Column(UUID(as_uuid=True), db.ForeignKey('resume.id', ondelete='CASCADE'), nullable=False)
     job_title_name = db.Column(db.String(200), nullable=False)
     experience_month = db.Column(db.Integer, default=0)
     experience_year = db.Column(db.Integer, default=0)
     job_fill_by_user = db.Column(db.String(200))
     is_main_skill = db.Column(db.Boolean, default=False)
-    project_info = db.Column(db.JSON)
-    created_on = db.Column(db.DateTime, default=datetime.utcnow)
+    project_info = db.Column(JSONB)
+    created_on = db.Column(db.DateTime, server_default=UTC_NOW)
     created_by = db.Column(db.String(36))
-    modified_on = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    modified_on = db.Column(db.DateTime, server_default=UTC_NOW, onupdate=func.timezone('utc', func.now()))
     modified_by = db.Column(db.String(36))
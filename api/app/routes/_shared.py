@@ -0,0 +1,315 @@
+import hashlib
+from operator import attrgetter
+from uuid import UUID, uuid4
+import ciso8601
+from flask import Response, current_app, request
+from flask_restx import abort, fields
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import raiseload
+from werkzeug.http import quote_etag
+from app import db
+from app.cache import cache_get, cache_set, detail_get, detail_set, list_version, resume_list_key
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+YIELD_PER = 1000
+
+# Audit columns shared by every model; splat into ns.model() definitions
+AUDIT_FIELDS = {
+    'created_on': fields.DateTime(required=False, description='Created date'),
+    'created_by': fields.String(required=False, description='Created by'),
+    'modified_on': fields.DateTime(required=False, description='Modified date'),
+    'modified_by': fields.String(required=False, description='Modified by'),
+}
+
+# Swagger documentation for the query args accepted by paginate()
+PAGINATION_PARAMS = {
+    'limit': {'description': f'Page size (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE})', 'type': 'integer'},
+    'offset': {'description': 'Number of rows to skip', 'type': 'integer'},
+    'after_id': {'description': 'Keyset cursor: only return rows with an ID greater than this one (see X-Next-Cursor)', 'type': 'string'},
+    'count': {'description': 'Set to true to receive the total row count in X-Total-Count', 'type': 'boolean'},
+}
+
+
+# Parse an ISO 8601 timestamp from a request payload, e.g. 2024-01-31T00:00:00Z
+parse_datetime = ciso8601.parse_datetime
+
+
+def parse_dates(data, keys):
+    """Parse the timestamp fields among keys that are present and non-empty in a payload"""
+    return {key: parse_datetime(data[key]) for key in keys if data.get(key)}
+
+
+def compile_marshaller(api_model):
+    """Precompute (key, getter) pairs for a Swagger model.
+
+    The returned function turns one row into the dict marshal() builds,
+    without walking the model's fields on every call. Datetimes and UUIDs
+    are left as-is for the orjson representation to encode; Nested fields
+    are compiled recursively.
+    """
+    getters = [(name, _field_getter(name, field)) for name, field in api_model.items()]
+
+    def marshal_row(obj):
+        return {key: get(obj) for key, get in getters}
+
+    return marshal_row
+
+
+def _field_getter(name, field):
+    get = attrgetter(field.attribute or name)
+    if not isinstance(field, fields.Nested):
+        return get
+    marshal_nested = compile_marshaller(field.nested)
+
+    def get_nested(obj):
+        value = get(obj)
+        return None if value is None else marshal_nested(value)
+
+    return get_nested
+
+
+def strict_loading():
+    """Loader options that make any unplanned lazy load raise, in debug and test runs only.
+
+    Add after the query's explicit eager loads so that a new Nested field
+    reading an unloaded relationship fails loudly instead of adding a query
+    per row.
+    """
+    if current_app.debug or current_app.testing:
+        return (raiseload('*', sql_only=True),)
+    return ()
+
+
+def make_etag(*parts):
+    """Hash the values that identify a representation into an ETag"""
+    return hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def select_columns(api_model, model):
+    """SELECT of the table columns behind a flat Swagger model, in model order.
+
+    Executing it yields plain Rows whose _asdict() is already the marshalled
+    output, skipping ORM instance construction on read-only endpoints.
+    """
+    return select(*[model.__table__.c[name] for name in api_model])
+
+
+def list_etag(namespace):
+    """ETag for a list request in namespace, or None when there is no version to derive one from.
+
+    Built from the namespace's write counter, which every create, update and
+    delete bumps after committing, so no aggregate query runs per request and
+    a late-committing write cannot leave the tag unchanged. Without Redis
+    there is no shared counter and lists are served without an ETag.
+    """
+    version = list_version(namespace)
+    if version is None:
+        return None
+    return make_etag(request.full_path, version)
+
+
+def etag_headers(etag):
+    """Response headers carrying etag, if there is one"""
+    return {'ETag': quote_etag(etag)} if etag else {}
+
+
+def not_modified(etag):
+    """Return an empty 304 response if the client already holds etag, otherwise None"""
+    if etag and request.if_none_match.contains(etag):
+        return Response(status=304, headers={'ETag': quote_etag(etag)})
+    return None
+
+
+def resume_list_response(namespace, resume_id, stmt, model):
+    """Serve a namespace's by-resume list through its Redis cache entry.
+
+    The cache holds [etag, items], so a hit answers both conditional and full
+    requests without touching the database. Writes invalidate the entry.
+    """
+    key = resume_list_key(namespace, resume_id)
+    entry = cache_get(key)
+    if entry is not None:
+        etag, items = entry
+        return not_modified(etag) or (items, 200, etag_headers(etag))
+
+    etag = list_etag(namespace)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    items = [row._asdict() for row in db.session.execute(stmt.order_by(model.id))]
+    cache_set(key, [etag, items])
+    return items, 200, etag_headers(etag)
+
+
+def detail_response(namespace, model, id_, marshal_row):
+    """Serve a single row with an ETag, from the in-process detail cache when fresh.
+
+    Bursts of GETs for the same row cost one query per DETAIL_CACHE_TTL;
+    PUT and DELETE handlers drop the entry with detail_delete().
+    """
+    entry = detail_get(namespace, id_)
+    if entry is None:
+        obj = get_or_404(model, id_)
+        entry = (make_etag(obj.id, obj.modified_on), marshal_row(obj))
+        detail_set(namespace, id_, entry)
+    etag, body = entry
+    return not_modified(etag) or (body, 200, {'ETag': quote_etag(etag)})
+
+
+def _int_arg(name, default, minimum):
+    """Read an integer query arg, aborting with 400 if it is malformed or below minimum"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        abort(400, f'{name} must be an integer')
+    if value < minimum:
+        abort(400, f'{name} must be at least {minimum}')
+    return value
+
+
+def paginate(stmt, model, scalars=False):
+    """Window a list statement using ?limit=&offset= or keyset ?after_id= args.
+
+    Returns the page's rows (ORM instances when scalars is set, for a
+    select(Model) statement) and the extra response headers for the page.
+    A full page sets X-Next-Cursor to the after_id of the next one.
+    Malformed args abort with 400 rather than silently restarting at the
+    first page, which would send a client following a bad cursor in circles.
+    """
+    limit = min(_int_arg('limit', DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+    after_id = request.args.get('after_id')
+    if after_id is not None:
+        try:
+            after_id = UUID(after_id)
+        except ValueError:
+            abort(400, 'after_id must be a UUID')
+
+    headers = {}
+    if request.args.get('count', '').lower() in ('1', 'true'):
+        total = db.session.execute(
+            stmt.with_only_columns(func.count(model.id), maintain_column_froms=True)).scalar()
+        headers['X-Total-Count'] = str(total)
+
+    stmt = stmt.order_by(model.id)
+    if after_id:
+        stmt = stmt.where(model.id > after_id)
+    else:
+        stmt = stmt.offset(_int_arg('offset', 0, 0))
+
+    result = db.session.execute(stmt.limit(limit).execution_options(yield_per=YIELD_PER))
+    rows = (result.scalars() if scalars else result).all()
+    if len(rows) == limit:
+        headers['X-Next-Cursor'] = str(rows[-1].id)
+    return rows, headers
+
+
+def bulk_insert(model, rows):
+    """Insert a batch of rows with a single executemany and return their IDs.
+
+    IDs are generated here rather than by the gen_random_uuid() default: with
+    server-generated keys SQLAlchemy cannot match RETURNING rows back to
+    request order, and falls back to one INSERT per row. Client-side keys let
+    insertmanyvalues send multi-row VALUES batches (insertmanyvalues_page_size).
+    """
+    ids = [uuid4() for _ in rows]
+    db.session.execute(insert(model.__table__), [{**row, 'id': id_} for row, id_ in zip(rows, ids)])
+    db.session.commit()
+    return [str(id_) for id_ in ids]
+
+
+def bulk_payload(to_fields):
+    """Map each item of a /bulk request body onto column values with to_fields.
+
+    The body must be a non-empty list of objects. An item that is missing a
+    required key or has an unparseable date aborts the whole request with a
+    400 naming its index, before anything is inserted.
+    """
+    data = request.json
+    if not isinstance(data, list) or not data:
+        abort(400, 'Expected a non-empty JSON array')
+    rows = []
+    for index, item in enumerate(data):
+        if not isinstance(item, dict):
+            abort(400, f'Item {index}: expected a JSON object')
+        try:
+            rows.append(to_fields(item))
+        except KeyError as e:
+            abort(400, f'Item {index}: missing required field {e.args[0]!r}')
+        except (TypeError, ValueError) as e:
+            abort(400, f'Item {index}: {e}')
+    return rows
+
+
+def get_or_404(model, id_, *options):
+    """Load one row by primary key with Session.get(), aborting with 404 if it does not exist.
+
+    Session.get() answers from the identity map when the row is already
+    loaded in this session; options are loader options such as selectinload().
+    """
+    obj = db.session.get(model, id_, options=options)
+    if obj is None:
+        abort(404)
+    return obj
+
+
+def one_or_404(stmt, **params):
+    """Execute a prebuilt single-row ORM select with params, aborting with 404 if it finds nothing.
+
+    Build stmt once at import time with bindparam() placeholders; reusing the
+    same statement object skips constructing it and generating its cache key
+    on every request.
+    """
+    obj = db.session.execute(stmt, params).scalar_one_or_none()
+    if obj is None:
+        abort(404)
+    return obj
+
+
+def insert_returning(model, values):
+    """Insert one row with a single INSERT ... RETURNING and return it as stored.
+
+    The returned row holds the values after the database's own coercion and
+    defaults (UUID spelling, integer casts, timestamps shifted to UTC), so
+    the response matches what a later GET serves.
+    """
+    stmt = insert(model.__table__).values(**values).returning(*model.__table__.c)
+    row = db.session.execute(stmt).one()
+    db.session.commit()
+    return row
+
+
+def update_returning(model, id_, values):
+    """Apply values to one row with a single UPDATE ... RETURNING, aborting with 404 if it does not exist.
+
+    Returns the updated row so the caller can marshal it without a follow-up SELECT.
+    """
+    stmt = (update(model)
+            .where(model.id == id_)
+            .values(**values)
+            .returning(*model.__table__.c)
+            .execution_options(synchronize_session=False))
+    row = db.session.execute(stmt).first()
+    if row is None:
+        abort(404)
+    db.session.commit()
+    return row
+
+
+def delete_by_id(model, id_):
+    """Delete one row with a single DELETE statement, aborting with 404 if it does not exist.
+
+    Returns the deleted row so the caller can invalidate caches keyed on it.
+    """
+    stmt = (delete(model)
+            .where(model.id == id_)
+            .returning(*model.__table__.c)
+            .execution_options(synchronize_session=False))
+    row = db.session.execute(stmt).first()
+    if row is None:
+        abort(404)
+    db.session.commit()
+    return row
@@ -1,8 +1,8 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from app import db
+from app.cache import detail_delete, invalidate_resume_children
 from app.models import Certificate
-from datetime import datetime
+from app.routes._shared import AUDIT_FIELDS, compile_marshaller, detail_response, etag_headers, list_etag, not_modified, paginate, resume_list_response, select_columns, bulk_insert, bulk_payload, delete_by_id, parse_dates, parse_datetime, update_returning, insert_returning, PAGINATION_PARAMS
 
 ns = Namespace('certificates', description='Certificate operations')
 
@@ -34,115 +34,111 @@ certificate_model = ns.model('Certificate', {
     'tech_type': fields.String(required=False, description='Tech type'),
     'reject_reason': fields.String(required=False, description='Reject reason'),
     'is_not_has_license_number': fields.Boolean(required=False, description='No license number flag'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
+marshal_certificate = compile_marshaller(certificate_model)
+CERTIFICATE_SELECT = select_columns(certificate_model, Certificate)
+
+# Columns a PUT may overwrite directly; dates and modified_by are handled separately
+CERT_UPDATABLE = frozenset({'certificate', 'certificate_authority', 'not_expired', 'score', 'license_no', 'certificate_url', 'foreign_language', 'subject', 'is_ctc_sponsor', 'grade', 'provider', 'field', 'sub_field', 'level', 'status', 'attendance', 'file_name', 'is_synced', 'is_education', 'tech_type', 'reject_reason', 'is_not_has_license_number'})
+
+def _certificate_fields(data):
+    """Map a request payload onto Certificate column values"""
+    return {
+        'resume_id': data['resume_id'],
+        'certificate': data['certificate'],
+        'certificate_authority': data.get('certificate_authority'),
+        'not_expired': data.get('not_expired', True),
+        'issue_date': parse_datetime(data['issue_date']) if data.get('issue_date') else None,
+        'expiration_date': parse_datetime(data['expiration_date']) if data.get('expiration_date') else None,
+        'score': data.get('score'),
+        'license_no': data.get('license_no'),
+        'certificate_url': data.get('certificate_url'),
+        'foreign_language': data.get('foreign_language'),
+        'subject': data.get('subject'),
+        'is_ctc_sponsor': data.get('is_ctc_sponsor', False),
+        'grade': data.get('grade'),
+        'provider': data.get('provider'),
+        'field': data.get('field'),
+        'sub_field': data.get('sub_field'),
+        'level': data.get('level'),
+        'status': data.get('status', 0),
+        'attendance': data.get('attendance', True),
+        'file_name': data.get('file_name'),
+        'is_synced': data.get('is_synced', False),
+        'is_education': data.get('is_education', False),
+        'tech_type': data.get('tech_type'),
+        'reject_reason': data.get('reject_reason'),
+        'is_not_has_license_number': data.get('is_not_has_license_number', False),
+        'created_by': data.get('created_by'),
+        'modified_by': data.get('modified_by')
+    }
+
 @ns.route('/')
 class CertificateList(Resource):
-    @ns.marshal_list_with(certificate_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [certificate_model])
     def get(self):
         """Get all certificates"""
-        certificates = Certificate.query.all()
-        return certificates
+        etag = list_etag(ns.name)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        certificates, headers = paginate(CERTIFICATE_SELECT, Certificate)
+        headers.update(etag_headers(etag))
+        return [row._asdict() for row in certificates], 200, headers
     
     @ns.expect(certificate_model)
-    @ns.marshal_with(certificate_model, code=201)
+    @ns.response(201, 'Success', certificate_model)
     def post(self):
         """Create a new certificate"""
-        data = request.json
-        certificate = Certificate(
-            resume_id=data['resume_id'],
-            certificate=data['certificate'],
-            certificate_authority=data.get('certificate_authority'),
-            not_expired=data.get('not_expired', True),
-            issue_date=datetime.fromisoformat(data['issue_date'].replace('Z', '+00:00')) if data.get('issue_date') else None,
-            expiration_date=datetime.fromisoformat(data['expiration_date'].replace('Z', '+00:00')) if data.get('expiration_date') else None,
-            score=data.get('score'),
-            license_no=data.get('license_no'),
-            certificate_url=data.get('certificate_url'),
-            foreign_language=data.get('foreign_language'),
-            subject=data.get('subject'),
-            is_ctc_sponsor=data.get('is_ctc_sponsor', False),
-            grade=data.get('grade'),
-            provider=data.get('provider'),
-            field=data.get('field'),
-            sub_field=data.get('sub_field'),
-            level=data.get('level'),
-            status=data.get('status', 0),
-            attendance=data.get('attendance', True),
-            file_name=data.get('file_name'),
-            is_synced=data.get('is_synced', False),
-            is_education=data.get('is_education', False),
-            tech_type=data.get('tech_type'),
-            reject_reason=data.get('reject_reason'),
-            is_not_has_license_number=data.get('is_not_has_license_number', False),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(certificate)
-        db.session.commit()
-        return certificate, 201
+        row = insert_returning(Certificate, _certificate_fields(request.json))
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_certificate(row), 201
+
+@ns.route('/bulk')
+class CertificateBulk(Resource):
+    @ns.expect([certificate_model])
+    @ns.response(201, 'Rows created')
+    def post(self):
+        """Create many certificates in one request"""
+        rows = bulk_payload(_certificate_fields)
+        ids = bulk_insert(Certificate, rows)
+        invalidate_resume_children(ns.name, *{row['resume_id'] for row in rows})
+        return {'ids': ids}, 201
 
-@ns.route('/<string:certificate_id>')
+@ns.route('/<uuid:certificate_id>')
 class CertificateDetail(Resource):
-    @ns.marshal_with(certificate_model)
+    @ns.response(200, 'Success', certificate_model)
     def get(self, certificate_id):
         """Get a specific certificate"""
-        certificate = Certificate.query.get_or_404(certificate_id)
-        return certificate
+        return detail_response(ns.name, Certificate, certificate_id, marshal_certificate)
     
     @ns.expect(certificate_model)
-    @ns.marshal_with(certificate_model)
+    @ns.response(200, 'Success', certificate_model)
     def put(self, certificate_id):
         """Update a specific certificate"""
-        certificate = Certificate.query.get_or_404(certificate_id)
         data = request.json
-        
-        certificate.certificate = data.get('certificate', certificate.certificate)
-        certificate.certificate_authority = data.get('certificate_authority', certificate.certificate_authority)
-        certificate.not_expired = data.get('not_expired', certificate.not_expired)
-        if data.get('issue_date'):
-            certificate.issue_date = datetime.fromisoformat(data['issue_date'].replace('Z', '+00:00'))
-        if data.get('expiration_date'):
-            certificate.expiration_date = datetime.fromisoformat(data['expiration_date'].replace('Z', '+00:00'))
-        certificate.score = data.get('score', certificate.score)
-        certificate.license_no = data.get('license_no', certificate.license_no)
-        certificate.certificate_url = data.get('certificate_url', certificate.certificate_url)
-        certificate.foreign_language = data.get('foreign_language', certificate.foreign_language)
-        certificate.subject = data.get('subject', certificate.subject)
-        certificate.is_ctc_sponsor = data.get('is_ctc_sponsor', certificate.is_ctc_sponsor)
-        certificate.grade = data.get('grade', certificate.grade)
-        certificate.provider = data.get('provider', certificate.provider)
-        certificate.field = data.get('field', certificate.field)
-        certificate.sub_field = data.get('sub_field', certificate.sub_field)
-        certificate.level = data.get('level', certificate.level)
-        certificate.status = data.get('status', certificate.status)
-        certificate.attendance = data.get('attendance', certificate.attendance)
-        certificate.file_name = data.get('file_name', certificate.file_name)
-        certificate.is_synced = data.get('is_synced', certificate.is_synced)
-        certificate.is_education = data.get('is_education', certificate.is_education)
-        certificate.tech_type = data.get('tech_type', certificate.tech_type)
-        certificate.reject_reason = data.get('reject_reason', certificate.reject_reason)
-        certificate.is_not_has_license_number = data.get('is_not_has_license_number', certificate.is_not_has_license_number)
-        certificate.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return certificate
+        values = {key: data[key] for key in data.keys() & CERT_UPDATABLE}
+        values.update(parse_dates(data, ('issue_date', 'expiration_date')))
+        values['modified_by'] = data.get('modified_by')
+        row = update_returning(Certificate, certificate_id, values)
+        invalidate_resume_children(ns.name, row.resume_id)
+        detail_delete(ns.name, certificate_id)
+        return marshal_certificate(row)
     
     def delete(self, certificate_id):
         """Delete a specific certificate"""
-        certificate = Certificate.query.get_or_404(certificate_id)
-        db.session.delete(certificate)
-        db.session.commit()
+        row = delete_by_id(Certificate, certificate_id)
+        invalidate_resume_children(ns.name, row.resume_id)
+        detail_delete(ns.name, certificate_id)
         return {'message': 'Certificate deleted successfully'}, 204
 
-@ns.route('/resume/<string:resume_id>')
+@ns.route('/resume/<uuid:resume_id>')
 class CertificateByResume(Resource):
-    @ns.marshal_list_with(certificate_model)
+    @ns.response(200, 'Success', [certificate_model])
     def get(self, resume_id):
         """Get all certificates for a specific resume"""
-        certificates = Certificate.query.filter_by(resume_id=resume_id).all()
-        return certificates
+        stmt = CERTIFICATE_SELECT.where(Certificate.resume_id == resume_id)
+        return resume_list_response(ns.name, resume_id, stmt, Certificate)
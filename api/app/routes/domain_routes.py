@@ -1,7 +1,8 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from app import db
+from app.cache import detail_delete, invalidate_resume_children
 from app.models import Domain
+from app.routes._shared import AUDIT_FIELDS, compile_marshaller, detail_response, etag_headers, list_etag, not_modified, paginate, resume_list_response, select_columns, bulk_insert, bulk_payload, delete_by_id, update_returning, insert_returning, PAGINATION_PARAMS
 
 ns = Namespace('domains', description='Domain operations')
 
@@ -12,71 +13,89 @@ domain_model = ns.model('Domain', {
     'name': fields.String(required=True, description='Domain name'),
     'year': fields.Integer(required=False, description='Years of experience'),
     'month': fields.Integer(required=False, description='Months of experience'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
+marshal_domain = compile_marshaller(domain_model)
+DOMAIN_SELECT = select_columns(domain_model, Domain)
+
+# Columns a PUT may overwrite directly; dates and modified_by are handled separately
+DOMAIN_UPDATABLE = frozenset({'name', 'year', 'month'})
+
+def _domain_fields(data):
+    """Map a request payload onto Domain column values"""
+    return {
+        'resume_id': data['resume_id'],
+        'name': data['name'],
+        'year': data.get('year', 0),
+        'month': data.get('month', 0),
+        'created_by': data.get('created_by'),
+        'modified_by': data.get('modified_by')
+    }
+
 @ns.route('/')
 class DomainList(Resource):
-    @ns.marshal_list_with(domain_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [domain_model])
     def get(self):
         """Get all domains"""
-        domains = Domain.query.all()
-        return domains
+        etag = list_etag(ns.name)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        domains, headers = paginate(DOMAIN_SELECT, Domain)
+        headers.update(etag_headers(etag))
+        return [row._asdict() for row in domains], 200, headers
     
     @ns.expect(domain_model)
-    @ns.marshal_with(domain_model, code=201)
+    @ns.response(201, 'Success', domain_model)
     def post(self):
         """Create a new domain"""
-        data = request.json
-        domain = Domain(
-            resume_id=data['resume_id'],
-            name=data['name'],
-            year=data.get('year', 0),
-            month=data.get('month', 0),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(domain)
-        db.session.commit()
-        return domain, 201
+        row = insert_returning(Domain, _domain_fields(request.json))
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_domain(row), 201
+
+@ns.route('/bulk')
+class DomainBulk(Resource):
+    @ns.expect([domain_model])
+    @ns.response(201, 'Rows created')
+    def post(self):
+        """Create many domains in one request"""
+        rows = bulk_payload(_domain_fields)
+        ids = bulk_insert(Domain, rows)
+        invalidate_resume_children(ns.name, *{row['resume_id'] for row in rows})
+        return {'ids': ids}, 201
 
-@ns.route('/<string:domain_id>')
+@ns.route('/<uuid:domain_id>')
 class DomainDetail(Resource):
-    @ns.marshal_with(domain_model)
+    @ns.response(200, 'Success', domain_model)
     def get(self, domain_id):
         """Get a specific domain"""
-        domain = Domain.query.get_or_404(domain_id)
-        return domain
+        return detail_response(ns.name, Domain, domain_id, marshal_domain)
     
     @ns.expect(domain_model)
-    @ns.marshal_with(domain_model)
+    @ns.response(200, 'Success', domain_model)
     def put(self, domain_id):
         """Update a specific domain"""
-        domain = Domain.query.get_or_404(domain_id)
         data = request.json
-        
-        domain.name = data.get('name', domain.name)
-        domain.year = data.get('year', domain.year)
-        domain.month = data.get('month', domain.month)
-        domain.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return domain
+        values = {key: data[key] for key in data.keys() & DOMAIN_UPDATABLE}
+        values['modified_by'] = data.get('modified_by')
+        row = update_returning(Domain, domain_id, values)
+        invalidate_resume_children(ns.name, row.resume_id)
+        detail_delete(ns.name, domain_id)
+        return marshal_domain(row)
     
     def delete(self, domain_id):
         """Delete a specific domain"""
-        domain = Domain.query.get_or_404(domain_id)
-        db.session.delete(domain)
-        db.session.commit()
+        row = delete_by_id(Domain, domain_id)
+        invalidate_resume_children(ns.name, row.resume_id)
+        detail_delete(ns.name, domain_id)
         return {'message': 'Domain deleted successfully'}, 204
 
-@ns.route('/resume/<string:resume_id>')
+@ns.route('/resume/<uuid:resume_id>')
 class DomainByResume(Resource):
-    @ns.marshal_list_with(domain_model)
+    @ns.response(200, 'Success', [domain_model])
     def get(self, resume_id):
         """Get all domains for a specific resume"""
-        domains = Domain.query.filter_by(resume_id=resume_id).all()
-        return domains
+        stmt = DOMAIN_SELECT.where(Domain.resume_id == resume_id)
+        return resume_list_response(ns.name, resume_id, stmt, Domain)
@@ -1,8 +1,8 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from app import db
+from app.cache import detail_delete, invalidate_resume_children
 from app.models import Education
-from datetime import datetime
+from app.routes._shared import AUDIT_FIELDS, compile_marshaller, detail_response, etag_headers, list_etag, not_modified, paginate, resume_list_response, select_columns, bulk_insert, bulk_payload, delete_by_id, parse_dates, parse_datetime, update_returning, insert_returning, PAGINATION_PARAMS
 
 ns = Namespace('education', description='Education operations')
 
@@ -17,81 +17,94 @@ education_model = ns.model('Education', {
     'end': fields.DateTime(required=False, description='End date'),
     'grade': fields.String(required=False, description='Grade or GPA'),
     'complete_degree': fields.Boolean(required=False, description='Degree completed'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
+marshal_education = compile_marshaller(education_model)
+EDUCATION_SELECT = select_columns(education_model, Education)
+
+# Columns a PUT may overwrite directly; dates and modified_by are handled separately
+EDUCATION_UPDATABLE = frozenset({'school', 'degree', 'major', 'grade', 'complete_degree'})
+
+def _education_fields(data):
+    """Map a request payload onto Education column values"""
+    return {
+        'resume_id': data['resume_id'],
+        'school': data['school'],
+        'degree': data['degree'],
+        'major': data['major'],
+        'start': parse_datetime(data['start']),
+        'end': parse_datetime(data['end']) if data.get('end') else None,
+        'grade': data.get('grade'),
+        'complete_degree': data.get('complete_degree', True),
+        'created_by': data.get('created_by'),
+        'modified_by': data.get('modified_by')
+    }
+
 @ns.route('/')
 class EducationList(Resource):
-    @ns.marshal_list_with(education_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [education_model])
     def get(self):
         """Get all education records"""
-        education_records = Education.query.all()
-        return education_records
+        etag = list_etag(ns.name)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        education_records, headers = paginate(EDUCATION_SELECT, Education)
+        headers.update(etag_headers(etag))
+        return [row._asdict() for row in education_records], 200, headers
     
     @ns.expect(education_model)
-    @ns.marshal_with(education_model, code=201)
+    @ns.response(201, 'Success', education_model)
     def post(self):
         """Create a new education record"""
-        data = request.json
-        education = Education(
-            resume_id=data['resume_id'],
-            school=data['school'],
-            degree=data['degree'],
-            major=data['major'],
-            start=datetime.fromisoformat(data['start'].replace('Z', '+00:00')),
-            end=datetime.fromisoformat(data['end'].replace('Z', '+00:00')) if data.get('end') else None,
-            grade=data.get('grade'),
-            complete_degree=data.get('complete_degree', True),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(education)
-        db.session.commit()
-        return education, 201
+        row = insert_returning(Education, _education_fields(request.json))
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_education(row), 201
+
+@ns.route('/bulk')
+class EducationBulk(Resource):
+    @ns.expect([education_model])
+    @ns.response(201, 'Rows created')
+    def post(self):
+        """Create many education records in one request"""
+        rows = bulk_payload(_education_fields)
+        ids = bulk_insert(Education, rows)
+        invalidate_resume_children(ns.name, *{row['resume_id'] for row in rows})
+        return {'ids': ids}, 201
 
-@ns.route('/<string:education_id>')
+@ns.route('/<uuid:education_id>')
 class EducationDetail(Resource):
-    @ns.marshal_with(education_model)
+    @ns.response(200, 'Success', education_model)
     def get(self, education_id):
         """Get a specific education record"""
-        education = Education.query.get_or_404(education_id)
-        return education
+        return detail_response(ns.name, Education, education_id, marshal_education)
     
     @ns.expect(education_model)
-    @ns.marshal_with(education_model)
+    @ns.response(200, 'Success', education_model)
     def put(self, education_id):
         """Update a specific education record"""
-        education = Education.query.get_or_404(education_id)
         data = request.json
-        
-        education.school = data.get('school', education.school)
-        education.degree = data.get('degree', education.degree)
-        education.major = data.get('major', education.major)
-        if data.get('start'):
-            education.start = datetime.fromisoformat(data['start'].replace('Z', '+00:00'))
-        if data.get('end'):
-            education.end = datetime.fromisoformat(data['end'].replace('Z', '+00:00'))
-        education.grade = data.get('grade', education.grade)
-        education.complete_degree = data.get('complete_degree', education.complete_degree)
-        education.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return education
+        values = {key: data[key] for key in data.keys() & EDUCATION_UPDATABLE}
+        values.update(parse_dates(data, ('start', 'end')))
+        values['modified_by'] = data.get('modified_by')
+        row = update_returning(Education, education_id, values)
+        invalidate_resume_children(ns.name, row.resume_id)
+        detail_delete(ns.name, education_id)
+        return marshal_education(row)
     
     def delete(self, education_id):
         """Delete a specific education record"""
-        education = Education.query.get_or_404(education_id)
-        db.session.delete(education)
-        db.session.commit()
+        row = delete_by_id(Education, education_id)
+        invalidate_resume_children(ns.name, row.resume_id)
+        detail_delete(ns.name, education_id)
         return {'message': 'Education record deleted successfully'}, 204
 
-@ns.route('/resume/<string:resume_id>')
+@ns.route('/resume/<uuid:resume_id>')
 class EducationByResume(Resource):
-    @ns.marshal_list_with(education_model)
+    @ns.response(200, 'Success', [education_model])
     def get(self, resume_id):
         """Get all education records for a specific resume"""
-        education_records = Education.query.filter_by(resume_id=resume_id).all()
-        return education_records
+        stmt = EDUCATION_SELECT.where(Education.resume_id == resume_id)
+        return resume_list_response(ns.name, resume_id, stmt, Education)
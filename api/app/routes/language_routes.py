@@ -1,7 +1,11 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
+from sqlalchemy import select
+from sqlalchemy.orm import raiseload, selectinload
 from app import db
+from app.cache import invalidate_resume_children, language_list_clear, language_list_get, language_list_set
 from app.models import Language, LanguageSkill
+from app.routes._shared import AUDIT_FIELDS, bulk_insert, bulk_payload, compile_marshaller, delete_by_id, get_or_404, insert_returning, paginate, strict_loading, update_returning, PAGINATION_PARAMS
 
 ns = Namespace('languages', description='Language operations')
 
@@ -9,10 +13,7 @@ ns = Namespace('languages', description='Language operations')
 language_model = ns.model('Language', {
     'id': fields.String(required=False, description='Language ID'),
     'name': fields.String(required=True, description='Language name'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
 language_skill_model = ns.model('LanguageSkill', {
@@ -20,121 +21,156 @@ language_skill_model = ns.model('LanguageSkill', {
     'resume_id': fields.String(required=True, description='Resume ID'),
     'language_id': fields.String(required=True, description='Language ID'),
     'proficiency': fields.Integer(required=False, description='Proficiency level'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by'),
+    **AUDIT_FIELDS,
     'language': fields.Nested(language_model, required=False)
 })
 
+marshal_language = compile_marshaller(language_model)
+marshal_language_skill = compile_marshaller(language_skill_model)
+
+# Columns a PUT may overwrite directly
+LANGUAGE_UPDATABLE = frozenset({'name'})
+LANGUAGE_SKILL_UPDATABLE = frozenset({'resume_id', 'language_id', 'proficiency'})
+
+def _language_skill_fields(data):
+    """Map a request payload onto LanguageSkill column values"""
+    return {
+        'resume_id': data['resume_id'],
+        'language_id': data['language_id'],
+        'proficiency': data.get('proficiency', 0),
+        'created_by': data.get('created_by'),
+        'modified_by': data.get('modified_by')
+    }
+
+def _language_skill_body(row):
+    """Marshal a RETURNING row of language_skills, nesting the language it now points to"""
+    language = db.session.get(Language, row.language_id)
+    return {**row._asdict(), 'language': marshal_language(language)}
+
 @ns.route('/')
 class LanguageList(Resource):
-    @ns.marshal_list_with(language_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [language_model])
     def get(self):
         """Get all languages"""
-        languages = Language.query.all()
-        return languages
+        entry = language_list_get(request.full_path)
+        if entry is None:
+            stmt = select(Language).options(raiseload('*'))
+            languages, headers = paginate(stmt, Language, scalars=True)
+            entry = ([marshal_language(language) for language in languages], headers)
+            language_list_set(request.full_path, entry)
+        items, headers = entry
+        return items, 200, headers
     
     @ns.expect(language_model)
-    @ns.marshal_with(language_model, code=201)
+    @ns.response(201, 'Success', language_model)
     def post(self):
         """Create a new language"""
         data = request.json
-        language = Language(
-            name=data['name'],
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(language)
-        db.session.commit()
-        return language, 201
+        row = insert_returning(Language, {
+            'name': data['name'],
+            'created_by': data.get('created_by'),
+            'modified_by': data.get('modified_by')
+        })
+        language_list_clear()
+        return marshal_language(row), 201
 
-@ns.route('/<string:language_id>')
+@ns.route('/<uuid:language_id>')
 class LanguageDetail(Resource):
-    @ns.marshal_with(language_model)
+    @ns.response(200, 'Success', language_model)
     def get(self, language_id):
         """Get a specific language"""
-        language = Language.query.get_or_404(language_id)
-        return language
+        language = get_or_404(Language, language_id, *strict_loading())
+        return marshal_language(language)
     
     @ns.expect(language_model)
-    @ns.marshal_with(language_model)
+    @ns.response(200, 'Success', language_model)
     def put(self, language_id):
         """Update a specific language"""
-        language = Language.query.get_or_404(language_id)
+        language = get_or_404(Language, language_id)
         data = request.json
         
-        language.name = data.get('name', language.name)
+        for key in data.keys() & LANGUAGE_UPDATABLE:
+            setattr(language, key, data[key])
         language.modified_by = data.get('modified_by')
         
         db.session.commit()
-        return language
+        language_list_clear()
+        return marshal_language(language)
     
     def delete(self, language_id):
         """Delete a specific language"""
-        language = Language.query.get_or_404(language_id)
-        db.session.delete(language)
-        db.session.commit()
+        delete_by_id(Language, language_id)
+        language_list_clear()
         return {'message': 'Language deleted successfully'}, 204
 
 @ns.route('/skills')
 class LanguageSkillList(Resource):
-    @ns.marshal_list_with(language_skill_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [language_skill_model])
     def get(self):
         """Get all language skills"""
-        language_skills = LanguageSkill.query.all()
-        return language_skills
+        stmt = select(LanguageSkill).options(selectinload(LanguageSkill.language), raiseload('*'))
+        language_skills, headers = paginate(stmt, LanguageSkill, scalars=True)
+        return [marshal_language_skill(skill) for skill in language_skills], 200, headers
     
     @ns.expect(language_skill_model)
-    @ns.marshal_with(language_skill_model, code=201)
+    @ns.response(201, 'Success', language_skill_model)
     def post(self):
         """Create a new language skill"""
-        data = request.json
-        language_skill = LanguageSkill(
-            resume_id=data['resume_id'],
-            language_id=data['language_id'],
-            proficiency=data.get('proficiency', 0),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(language_skill)
-        db.session.commit()
-        return language_skill, 201
+        row = insert_returning(LanguageSkill, _language_skill_fields(request.json))
+        invalidate_resume_children(ns.name, row.resume_id)
+        return _language_skill_body(row), 201
+
+@ns.route('/skills/bulk')
+class LanguageSkillBulk(Resource):
+    @ns.expect([language_skill_model])
+    @ns.response(201, 'Rows created')
+    def post(self):
+        """Create many language skills in one request"""
+        rows = bulk_payload(_language_skill_fields)
+        ids = bulk_insert(LanguageSkill, rows)
+        invalidate_resume_children(ns.name, *{row['resume_id'] for row in rows})
+        return {'ids': ids}, 201
 
-@ns.route('/skills/<string:skill_id>')
+@ns.route('/skills/<uuid:skill_id>')
 class LanguageSkillDetail(Resource):
-    @ns.marshal_with(language_skill_model)
+    @ns.response(200, 'Success', language_skill_model)
     def get(self, skill_id):
         """Get a specific language skill"""
-        language_skill = LanguageSkill.query.get_or_404(skill_id)
-        return language_skill
+        language_skill = get_or_404(LanguageSkill, skill_id, selectinload(LanguageSkill.language), *strict_loading())
+        return marshal_language_skill(language_skill)
     
     @ns.expect(language_skill_model)
-    @ns.marshal_with(language_skill_model)
+    @ns.response(200, 'Success', language_skill_model)
     def put(self, skill_id):
         """Update a specific language skill"""
-        language_skill = LanguageSkill.query.get_or_404(skill_id)
         data = request.json
-        
-        language_skill.resume_id = data.get('resume_id', language_skill.resume_id)
-        language_skill.language_id = data.get('language_id', language_skill.language_id)
-        language_skill.proficiency = data.get('proficiency', language_skill.proficiency)
-        language_skill.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return language_skill
+        values = {key: data[key] for key in data.keys() & LANGUAGE_SKILL_UPDATABLE}
+        values['modified_by'] = data.get('modified_by')
+        # RETURNING only reports the new resume_id; fetch the old one if the skill may move
+        previous_resume_id = None
+        if 'resume_id' in values:
+            previous_resume_id = db.session.scalar(
+                select(LanguageSkill.resume_id).where(LanguageSkill.id == skill_id))
+        row = update_returning(LanguageSkill, skill_id, values)
+        invalidate_resume_children(ns.name, *{previous_resume_id or row.resume_id, row.resume_id})
+        return _language_skill_body(row)
     
     def delete(self, skill_id):
         """Delete a specific language skill"""
-        language_skill = LanguageSkill.query.get_or_404(skill_id)
-        db.session.delete(language_skill)
-        db.session.commit()
+        row = delete_by_id(LanguageSkill, skill_id)
+        invalidate_resume_children(ns.name, row.resume_id)
         return {'message': 'Language skill deleted successfully'}, 204
 
-@ns.route('/skills/resume/<string:resume_id>')
+@ns.route('/skills/resume/<uuid:resume_id>')
 class LanguageSkillByResume(Resource):
-    @ns.marshal_list_with(language_skill_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [language_skill_model])
     def get(self, resume_id):
         """Get all language skills for a specific resume"""
-        language_skills = LanguageSkill.query.filter_by(resume_id=resume_id).all()
-        return language_skills
+        stmt = (select(LanguageSkill)
+                .options(selectinload(LanguageSkill.language), raiseload('*'))
+                .where(LanguageSkill.resume_id == resume_id))
+        language_skills, headers = paginate(stmt, LanguageSkill, scalars=True)
+        return [marshal_language_skill(skill) for skill in language_skills], 200, headers
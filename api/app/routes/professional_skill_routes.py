@@ -1,7 +1,8 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from app import db
+from app.cache import invalidate_resume_children
 from app.models import ProfessionalSkill
+from app.routes._shared import AUDIT_FIELDS, bulk_insert, bulk_payload, compile_marshaller, delete_by_id, get_or_404, insert_returning, paginate, select_columns, strict_loading, update_returning, PAGINATION_PARAMS
 
 ns = Namespace('professional-skills', description='Professional skill operations')
 
@@ -15,77 +16,88 @@ professional_skill_model = ns.model('ProfessionalSkill', {
     'job_fill_by_user': fields.String(required=False, description='Job filled by user'),
     'is_main_skill': fields.Boolean(required=False, description='Main skill flag'),
     'project_info': fields.List(fields.Raw, required=False, description='Project information'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
+marshal_professional_skill = compile_marshaller(professional_skill_model)
+PROFESSIONAL_SKILL_SELECT = select_columns(professional_skill_model, ProfessionalSkill)
+
+# Columns a PUT may overwrite directly
+PROFESSIONAL_SKILL_UPDATABLE = frozenset({'job_title_name', 'experience_month', 'experience_year', 'job_fill_by_user', 'is_main_skill', 'project_info'})
+
+def _professional_skill_fields(data):
+    """Map a request payload onto ProfessionalSkill column values"""
+    return {
+        'resume_id': data['resume_id'],
+        'job_title_name': data['job_title_name'],
+        'experience_month': data.get('experience_month', 0),
+        'experience_year': data.get('experience_year', 0),
+        'job_fill_by_user': data.get('job_fill_by_user'),
+        'is_main_skill': data.get('is_main_skill', False),
+        'project_info': data.get('project_info'),
+        'created_by': data.get('created_by'),
+        'modified_by': data.get('modified_by')
+    }
+
 @ns.route('/')
 class ProfessionalSkillList(Resource):
-    @ns.marshal_list_with(professional_skill_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [professional_skill_model])
     def get(self):
         """Get all professional skills"""
-        professional_skills = ProfessionalSkill.query.all()
-        return professional_skills
+        professional_skills, headers = paginate(PROFESSIONAL_SKILL_SELECT, ProfessionalSkill)
+        return [row._asdict() for row in professional_skills], 200, headers
     
     @ns.expect(professional_skill_model)
-    @ns.marshal_with(professional_skill_model, code=201)
+    @ns.response(201, 'Success', professional_skill_model)
     def post(self):
         """Create a new professional skill"""
-        data = request.json
-        professional_skill = ProfessionalSkill(
-            resume_id=data['resume_id'],
-            job_title_name=data['job_title_name'],
-            experience_month=data.get('experience_month', 0),
-            experience_year=data.get('experience_year', 0),
-            job_fill_by_user=data.get('job_fill_by_user'),
-            is_main_skill=data.get('is_main_skill', False),
-            project_info=data.get('project_info'),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(professional_skill)
-        db.session.commit()
-        return professional_skill, 201
+        row = insert_returning(ProfessionalSkill, _professional_skill_fields(request.json))
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_professional_skill(row), 201
+
+@ns.route('/bulk')
+class ProfessionalSkillBulk(Resource):
+    @ns.expect([professional_skill_model])
+    @ns.response(201, 'Rows created')
+    def post(self):
+        """Create many professional skills in one request"""
+        rows = bulk_payload(_professional_skill_fields)
+        ids = bulk_insert(ProfessionalSkill, rows)
+        invalidate_resume_children(ns.name, *{row['resume_id'] for row in rows})
+        return {'ids': ids}, 201
 
-@ns.route('/<string:skill_id>')
+@ns.route('/<uuid:skill_id>')
 class ProfessionalSkillDetail(Resource):
-    @ns.marshal_with(professional_skill_model)
+    @ns.response(200, 'Success', professional_skill_model)
     def get(self, skill_id):
         """Get a specific professional skill"""
-        professional_skill = ProfessionalSkill.query.get_or_404(skill_id)
-        return professional_skill
+        professional_skill = get_or_404(ProfessionalSkill, skill_id, *strict_loading())
+        return marshal_professional_skill(professional_skill)
     
     @ns.expect(professional_skill_model)
-    @ns.marshal_with(professional_skill_model)
+    @ns.response(200, 'Success', professional_skill_model)
     def put(self, skill_id):
         """Update a specific professional skill"""
-        professional_skill = ProfessionalSkill.query.get_or_404(skill_id)
         data = request.json
-        
-        professional_skill.job_title_name = data.get('job_title_name', professional_skill.job_title_name)
-        professional_skill.experience_month = data.get('experience_month', professional_skill.experience_month)
-        professional_skill.experience_year = data.get('experience_year', professional_skill.experience_year)
-        professional_skill.job_fill_by_user = data.get('job_fill_by_user', professional_skill.job_fill_by_user)
-        professional_skill.is_main_skill = data.get('is_main_skill', professional_skill.is_main_skill)
-        professional_skill.project_info = data.get('project_info', professional_skill.project_info)
-        professional_skill.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return professional_skill
+        values = {key: data[key] for key in data.keys() & PROFESSIONAL_SKILL_UPDATABLE}
+        values['modified_by'] = data.get('modified_by')
+        row = update_returning(ProfessionalSkill, skill_id, values)
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_professional_skill(row)
     
     def delete(self, skill_id):
         """Delete a specific professional skill"""
-        professional_skill = ProfessionalSkill.query.get_or_404(skill_id)
-        db.session.delete(professional_skill)
-        db.session.commit()
+        row = delete_by_id(ProfessionalSkill, skill_id)
+        invalidate_resume_children(ns.name, row.resume_id)
         return {'message': 'Professional skill deleted successfully'}, 204
 
-@ns.route('/resume/<string:resume_id>')
+@ns.route('/resume/<uuid:resume_id>')
 class ProfessionalSkillByResume(Resource):
-    @ns.marshal_list_with(professional_skill_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [professional_skill_model])
     def get(self, resume_id):
         """Get all professional skills for a specific resume"""
-        professional_skills = ProfessionalSkill.query.filter_by(resume_id=resume_id).all()
-        return professional_skills
+        stmt = PROFESSIONAL_SKILL_SELECT.where(ProfessionalSkill.resume_id == resume_id)
+        professional_skills, headers = paginate(stmt, ProfessionalSkill)
+        return [row._asdict() for row in professional_skills], 200, headers
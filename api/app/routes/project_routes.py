@@ -1,8 +1,8 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from app import db
+from app.cache import invalidate_resume_children
 from app.models import Project
-from datetime import datetime
+from app.routes._shared import AUDIT_FIELDS, bulk_insert, bulk_payload, compile_marshaller, delete_by_id, get_or_404, insert_returning, paginate, parse_dates, parse_datetime, select_columns, strict_loading, update_returning, PAGINATION_PARAMS
 
 ns = Namespace('projects', description='Project operations')
 
@@ -43,133 +43,116 @@ project_model = ns.model('Project', {
     'skill': fields.String(required=False, description='Skill'),
     'skill_code': fields.String(required=False, description='Skill code'),
     'seniority': fields.String(required=False, description='Seniority level'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
+marshal_project = compile_marshaller(project_model)
+PROJECT_SELECT = select_columns(project_model, Project)
+
+# Columns a PUT may overwrite directly; dates are parsed separately
+PROJECT_UPDATABLE = frozenset({'name', 'resume_project_id', 'project_id', 'project_key', 'project_code', 'project_rank', 'project_lead', 'project_category', 'customer_code', 'contract_type', 'url', 'company', 'type', 'team_size', 'search_skill', 'technology', 'project_description', 'groupname', 'status', 'domain', 'pain_points', 'key_findings', 'working_process', 'responsibility', 'technology_by_pm', 'description_by_pm', 'is_update_team', 'apply_incompleted', 'skill', 'skill_code', 'seniority'})
+
+def _project_fields(data):
+    """Map a request payload onto Project column values"""
+    return {
+        'resume_id': data['resume_id'],
+        'resume_project_id': data.get('resume_project_id'),
+        'project_id': data.get('project_id'),
+        'name': data['name'],
+        'project_key': data.get('project_key'),
+        'project_code': data.get('project_code'),
+        'project_rank': data.get('project_rank'),
+        'project_lead': data.get('project_lead'),
+        'project_category': data.get('project_category'),
+        'customer_code': data.get('customer_code'),
+        'contract_type': data.get('contract_type'),
+        'url': data.get('url'),
+        'company': data.get('company'),
+        'type': data.get('type'),
+        'team_size': data.get('team_size', 0),
+        'search_skill': data.get('search_skill', 0),
+        'technology': data.get('technology'),
+        'project_description': data.get('project_description'),
+        'groupname': data.get('groupname'),
+        'status': data.get('status'),
+        'domain': data.get('domain'),
+        'start_date': parse_datetime(data['start_date']) if data.get('start_date') else None,
+        'end_date': parse_datetime(data['end_date']) if data.get('end_date') else None,
+        'pain_points': data.get('pain_points'),
+        'key_findings': data.get('key_findings'),
+        'working_process': data.get('working_process'),
+        'responsibility': data.get('responsibility'),
+        'technology_by_pm': data.get('technology_by_pm'),
+        'description_by_pm': data.get('description_by_pm'),
+        'is_update_team': data.get('is_update_team', False),
+        'apply_incompleted': data.get('apply_incompleted', False),
+        'skill': data.get('skill'),
+        'skill_code': data.get('skill_code'),
+        'seniority': data.get('seniority'),
+        'created_by': data.get('created_by'),
+        'modified_by': data.get('modified_by')
+    }
+
 @ns.route('/')
 class ProjectList(Resource):
-    @ns.marshal_list_with(project_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [project_model])
     def get(self):
         """Get all projects"""
-        projects = Project.query.all()
-        return projects
+        projects, headers = paginate(PROJECT_SELECT, Project)
+        return [row._asdict() for row in projects], 200, headers
     
     @ns.expect(project_model)
-    @ns.marshal_with(project_model, code=201)
+    @ns.response(201, 'Success', project_model)
     def post(self):
         """Create a new project"""
-        data = request.json
-        project = Project(
-            resume_id=data['resume_id'],
-            resume_project_id=data.get('resume_project_id'),
-            project_id=data.get('project_id'),
-            name=data['name'],
-            project_key=data.get('project_key'),
-            project_code=data.get('project_code'),
-            project_rank=data.get('project_rank'),
-            project_lead=data.get('project_lead'),
-            project_category=data.get('project_category'),
-            customer_code=data.get('customer_code'),
-            contract_type=data.get('contract_type'),
-            url=data.get('url'),
-            company=data.get('company'),
-            type=data.get('type'),
-            team_size=data.get('team_size', 0),
-            search_skill=data.get('search_skill', 0),
-            technology=data.get('technology'),
-            project_description=data.get('project_description'),
-            groupname=data.get('groupname'),
-            status=data.get('status'),
-            domain=data.get('domain'),
-            start_date=datetime.fromisoformat(data['start_date'].replace('Z', '+00:00')) if data.get('start_date') else None,
-            end_date=datetime.fromisoformat(data['end_date'].replace('Z', '+00:00')) if data.get('end_date') else None,
-            pain_points=data.get('pain_points'),
-            key_findings=data.get('key_findings'),
-            working_process=data.get('working_process'),
-            responsibility=data.get('responsibility'),
-            technology_by_pm=data.get('technology_by_pm'),
-            description_by_pm=data.get('description_by_pm'),
-            is_update_team=data.get('is_update_team', False),
-            apply_incompleted=data.get('apply_incompleted', False),
-            skill=data.get('skill'),
-            skill_code=data.get('skill_code'),
-            seniority=data.get('seniority'),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(project)
-        db.session.commit()
-        return project, 201
+        row = insert_returning(Project, _project_fields(request.json))
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_project(row), 201
+
+@ns.route('/bulk')
+class ProjectBulk(Resource):
+    @ns.expect([project_model])
+    @ns.response(201, 'Rows created')
+    def post(self):
+        """Create many projects in one request"""
+        rows = bulk_payload(_project_fields)
+        ids = bulk_insert(Project, rows)
+        invalidate_resume_children(ns.name, *{row['resume_id'] for row in rows})
+        return {'ids': ids}, 201
 
-@ns.route('/<string:project_id>')
+@ns.route('/<uuid:project_id>')
 class ProjectDetail(Resource):
-    @ns.marshal_with(project_model)
+    @ns.response(200, 'Success', project_model)
     def get(self, project_id):
         """Get a specific project"""
-        project = Project.query.get_or_404(project_id)
-        return project
+        project = get_or_404(Project, project_id, *strict_loading())
+        return marshal_project(project)
     
     @ns.expect(project_model)
-    @ns.marshal_with(project_model)
+    @ns.response(200, 'Success', project_model)
     def put(self, project_id):
         """Update a specific project"""
-        project = Project.query.get_or_404(project_id)
         data = request.json
-        
-        project.name = data.get('name', project.name)
-        project.resume_project_id = data.get('resume_project_id', project.resume_project_id)
-        project.project_id = data.get('project_id', project.project_id)
-        project.project_key = data.get('project_key', project.project_key)
-        project.project_code = data.get('project_code', project.project_code)
-        project.project_rank = data.get('project_rank', project.project_rank)
-        project.project_lead = data.get('project_lead', project.project_lead)
-        project.project_category = data.get('project_category', project.project_category)
-        project.customer_code = data.get('customer_code', project.customer_code)
-        project.contract_type = data.get('contract_type', project.contract_type)
-        project.url = data.get('url', project.url)
-        project.company = data.get('company', project.company)
-        project.type = data.get('type', project.type)
-        project.team_size = data.get('team_size', project.team_size)
-        project.search_skill = data.get('search_skill', project.search_skill)
-        project.technology = data.get('technology', project.technology)
-        project.project_description = data.get('project_description', project.project_description)
-        project.groupname = data.get('groupname', project.groupname)
-        project.status = data.get('status', project.status)
-        project.domain = data.get('domain', project.domain)
-        if data.get('start_date'):
-            project.start_date = datetime.fromisoformat(data['start_date'].replace('Z', '+00:00'))
-        if data.get('end_date'):
-            project.end_date = datetime.fromisoformat(data['end_date'].replace('Z', '+00:00'))
-        project.pain_points = data.get('pain_points', project.pain_points)
-        project.key_findings = data.get('key_findings', project.key_findings)
-        project.working_process = data.get('working_process', project.working_process)
-        project.responsibility = data.get('responsibility', project.responsibility)
-        project.technology_by_pm = data.get('technology_by_pm', project.technology_by_pm)
-        project.description_by_pm = data.get('description_by_pm', project.description_by_pm)
-        project.is_update_team = data.get('is_update_team', project.is_update_team)
-        project.apply_incompleted = data.get('apply_incompleted', project.apply_incompleted)
-        project.skill = data.get('skill', project.skill)
-        project.skill_code = data.get('skill_code', project.skill_code)
-        project.seniority = data.get('seniority', project.seniority)
-        project.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return project
+        values = {key: data[key] for key in data.keys() & PROJECT_UPDATABLE}
+        values.update(parse_dates(data, ('start_date', 'end_date')))
+        values['modified_by'] = data.get('modified_by')
+        row = update_returning(Project, project_id, values)
+        invalidate_resume_children(ns.name, row.resume_id)
+        return marshal_project(row)
     
     def delete(self, project_id):
         """Delete a specific project"""
-        project = Project.query.get_or_404(project_id)
-        db.session.delete(project)
-        db.session.commit()
+        row = delete_by_id(Project, project_id)
+        invalidate_resume_children(ns.name, row.resume_id)
         return {'message': 'Project deleted successfully'}, 204
 
-@ns.route('/resume/<string:resume_id>')
+@ns.route('/resume/<uuid:resume_id>')
 class ProjectByResume(Resource):
-    @ns.marshal_list_with(project_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [project_model])
     def get(self, resume_id):
         """Get all projects for a specific resume"""
-        projects = Project.query.filter_by(resume_id=resume_id).all()
-        return projects
+        stmt = PROJECT_SELECT.where(Project.resume_id == resume_id)
+        projects, headers = paginate(stmt, Project)
+        return [row._asdict() for row in projects], 200, headers
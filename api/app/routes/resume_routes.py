@@ -1,7 +1,12 @@
-from flask import request
+from operator import attrgetter
+from flask import current_app, request
 from flask_restx import Namespace, Resource, fields
-from app import db
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import lazyload, raiseload, selectinload
+from app.cache import RESUME_FULL_TTL, cache_delete, cache_get_bytes, cache_set_bytes, invalidate_resume, resume_full_key
 from app.models import Resume, Education, Certificate, LanguageSkill, Language, Domain, Project, ProfessionalSkill
+from app.representations import encode_json
+from app.routes._shared import AUDIT_FIELDS, compile_marshaller, delete_by_id, insert_returning, one_or_404, paginate, select_columns, update_returning, PAGINATION_PARAMS
 
 ns = Namespace('resumes', description='Resume operations')
 
@@ -13,252 +18,151 @@ resume_model = ns.model('Resume', {
     'email': fields.String(required=False, description='Email address'),
     'phone': fields.String(required=False, description='Phone number'),
     'summary': fields.String(required=False, description='Professional summary'),
-    'created_on': fields.DateTime(required=False, description='Created date'),
-    'created_by': fields.String(required=False, description='Created by'),
-    'modified_on': fields.DateTime(required=False, description='Modified date'),
-    'modified_by': fields.String(required=False, description='Modified by')
+    **AUDIT_FIELDS
 })
 
+marshal_resume = compile_marshaller(resume_model)
+RESUME_SELECT = select_columns(resume_model, Resume)
+
+# Columns a PUT may overwrite directly
+RESUME_UPDATABLE = frozenset({'first_name', 'last_name', 'email', 'phone', 'summary'})
+
+# Every collection /full serialises, one SELECT ... IN per relationship;
+# any other lazy load raises instead of quietly adding queries
+FULL_RESUME_OPTIONS = (
+    selectinload(Resume.educations),
+    selectinload(Resume.certificates),
+    selectinload(Resume.languages).selectinload(LanguageSkill.language),
+    selectinload(Resume.domains),
+    selectinload(Resume.projects),
+    selectinload(Resume.professional_skills),
+    raiseload('*'),
+)
+
+# Primary-key lookups, built once and reused with the ID bound per request
+RESUME_BY_ID = select(Resume).options(lazyload('*')).where(Resume.id == bindparam('resume_id'))
+FULL_RESUME_BY_ID = select(Resume).options(*FULL_RESUME_OPTIONS).where(Resume.id == bindparam('resume_id'))
+
+def _full_row_builder(*columns):
+    """Compile a /full row serialiser that fetches every column with one attrgetter call"""
+    get = attrgetter(*columns)
+
+    def build(obj):
+        return dict(zip(columns, get(obj)))
+
+    return build
+
+# Columns /full emits per row. Values are left raw: output_json's orjson
+# encodes UUIDs as strings and datetimes as ISO 8601 itself
+_FULL_AUDIT = ('created_on', 'created_by', 'modified_on', 'modified_by')
+
+_full_resume = _full_row_builder('id', 'first_name', 'last_name', 'email', 'phone', 'summary', *_FULL_AUDIT)
+_full_education = _full_row_builder('id', 'school', 'degree', 'major', 'start', 'end', 'grade', 'complete_degree', *_FULL_AUDIT)
+_full_certificate = _full_row_builder(
+    'id', 'certificate', 'certificate_authority', 'not_expired',
+    'issue_date', 'expiration_date', 'score', 'license_no',
+    'certificate_url', 'foreign_language', 'subject', 'is_ctc_sponsor',
+    'grade', 'certificate_catalog_id', 'provider_id', 'provider',
+    'field_id', 'field', 'sub_field_id', 'sub_field', 'level_id',
+    'level', 'status', 'attendance', 'file_name', 'is_synced',
+    'is_education', 'tech_type', 'reject_reason', 'is_not_has_license_number',
+    *_FULL_AUDIT,
+)
+_full_language_skill = _full_row_builder('id', 'language_id', 'proficiency', *_FULL_AUDIT)
+_full_language = _full_row_builder('id', 'name', *_FULL_AUDIT)
+_full_domain = _full_row_builder('id', 'name', 'year', 'month', *_FULL_AUDIT)
+_full_project = _full_row_builder(
+    'id', 'resume_project_id', 'project_id', 'name', 'project_key',
+    'project_code', 'project_rank', 'project_lead', 'project_category',
+    'customer_code', 'contract_type', 'url', 'company', 'type',
+    'team_size', 'search_skill', 'technology', 'project_description',
+    'groupname', 'status', 'domain', 'start_date', 'end_date',
+    'pain_points', 'key_findings', 'working_process', 'responsibility',
+    'technology_by_pm', 'description_by_pm', 'is_update_team',
+    'apply_incompleted', 'skill', 'skill_code', 'seniority',
+    *_FULL_AUDIT,
+)
+_full_professional_skill = _full_row_builder(
+    'id', 'job_title_name', 'experience_month', 'experience_year',
+    'job_fill_by_user', 'is_main_skill', 'project_info',
+    *_FULL_AUDIT,
+)
+
 @ns.route('/')
 class ResumeList(Resource):
-    @ns.marshal_list_with(resume_model)
+    @ns.doc(params=PAGINATION_PARAMS)
+    @ns.response(200, 'Success', [resume_model])
     def get(self):
         """Get all resumes"""
-        resumes = Resume.query.all()
-        return resumes
+        resumes, headers = paginate(RESUME_SELECT, Resume)
+        return [row._asdict() for row in resumes], 200, headers
     
     @ns.expect(resume_model)
-    @ns.marshal_with(resume_model, code=201)
+    @ns.response(201, 'Success', resume_model)
     def post(self):
         """Create a new resume"""
         data = request.json
-        resume = Resume(
-            first_name=data['first_name'],
-            last_name=data['last_name'],
-            email=data.get('email'),
-            phone=data.get('phone'),
-            summary=data.get('summary'),
-            created_by=data.get('created_by'),
-            modified_by=data.get('modified_by')
-        )
-        db.session.add(resume)
-        db.session.commit()
-        return resume, 201
+        row = insert_returning(Resume, {
+            'first_name': data['first_name'],
+            'last_name': data['last_name'],
+            'email': data.get('email'),
+            'phone': data.get('phone'),
+            'summary': data.get('summary'),
+            'created_by': data.get('created_by'),
+            'modified_by': data.get('modified_by')
+        })
+        return marshal_resume(row), 201
 
-@ns.route('/<string:resume_id>')
+@ns.route('/<uuid:resume_id>')
 class ResumeDetail(Resource):
-    @ns.marshal_with(resume_model)
+    @ns.response(200, 'Success', resume_model)
     def get(self, resume_id):
         """Get a specific resume"""
-        resume = Resume.query.get_or_404(resume_id)
-        return resume
+        resume = one_or_404(RESUME_BY_ID, resume_id=resume_id)
+        return marshal_resume(resume)
     
     @ns.expect(resume_model)
-    @ns.marshal_with(resume_model)
+    @ns.response(200, 'Success', resume_model)
     def put(self, resume_id):
         """Update a specific resume"""
-        resume = Resume.query.get_or_404(resume_id)
         data = request.json
-        
-        resume.first_name = data.get('first_name', resume.first_name)
-        resume.last_name = data.get('last_name', resume.last_name)
-        resume.email = data.get('email', resume.email)
-        resume.phone = data.get('phone', resume.phone)
-        resume.summary = data.get('summary', resume.summary)
-        resume.modified_by = data.get('modified_by')
-        
-        db.session.commit()
-        return resume
+        values = {key: data[key] for key in data.keys() & RESUME_UPDATABLE}
+        values['modified_by'] = data.get('modified_by')
+        row = update_returning(Resume, resume_id, values)
+        cache_delete(resume_full_key(resume_id))
+        return marshal_resume(row)
     
     def delete(self, resume_id):
         """Delete a specific resume"""
-        resume = Resume.query.get_or_404(resume_id)
-        db.session.delete(resume)
-        db.session.commit()
+        delete_by_id(Resume, resume_id)
+        invalidate_resume(resume_id)
         return {'message': 'Resume deleted successfully'}, 204
 
-@ns.route('/<string:resume_id>/full')
+@ns.route('/<uuid:resume_id>/full')
 class ResumeFullData(Resource):
     def get(self, resume_id):
         """Get complete resume data with all related information in nested structure"""
-        resume = Resume.query.get_or_404(resume_id)
+        key = resume_full_key(resume_id)
+        body = cache_get_bytes(key)
+        if body is not None:
+            return current_app.response_class(body, mimetype='application/json')
         
-        # Helper function to format datetime fields
-        def format_datetime(dt):
-            return dt.isoformat() if dt else None
+        resume = one_or_404(FULL_RESUME_BY_ID, resume_id=resume_id)
         
         # Build the nested response structure
-        response_data = {
-            "id": resume.id,
-            "first_name": resume.first_name,
-            "last_name": resume.last_name,
-            "email": resume.email,
-            "phone": resume.phone,
-            "summary": resume.summary,
-            "created_on": format_datetime(resume.created_on),
-            "created_by": resume.created_by,
-            "modified_on": format_datetime(resume.modified_on),
-            "modified_by": resume.modified_by,
-            "educations": [],
-            "certificates": [],
-            "languages": [],
-            "domains": [],
-            "projects": [],
-            "professional_skills": []
-        }
-        
-        # Add education data
-        for education in resume.educations:
-            education_data = {
-                "id": education.id,
-                "school": education.school,
-                "degree": education.degree,
-                "major": education.major,
-                "start": format_datetime(education.start),
-                "end": format_datetime(education.end),
-                "grade": education.grade,
-                "complete_degree": education.complete_degree,
-                "created_on": format_datetime(education.created_on),
-                "created_by": education.created_by,
-                "modified_on": format_datetime(education.modified_on),
-                "modified_by": education.modified_by
-            }
-            response_data["educations"].append(education_data)
-        
-        # Add certificate data
-        for certificate in resume.certificates:
-            certificate_data = {
-                "id": certificate.id,
-                "certificate": certificate.certificate,
-                "certificate_authority": certificate.certificate_authority,
-                "not_expired": certificate.not_expired,
-                "issue_date": format_datetime(certificate.issue_date),
-                "expiration_date": format_datetime(certificate.expiration_date),
-                "score": certificate.score,
-                "license_no": certificate.license_no,
-                "certificate_url": certificate.certificate_url,
-                "foreign_language": certificate.foreign_language,
-                "subject": certificate.subject,
-                "is_ctc_sponsor": certificate.is_ctc_sponsor,
-                "grade": certificate.grade,
-                "certificate_catalog_id": certificate.certificate_catalog_id,
-                "provider_id": certificate.provider_id,
-                "provider": certificate.provider,
-                "field_id": certificate.field_id,
-                "field": certificate.field,
-                "sub_field_id": certificate.sub_field_id,
-                "sub_field": certificate.sub_field,
-                "level_id": certificate.level_id,
-                "level": certificate.level,
-                "status": certificate.status,
-                "attendance": certificate.attendance,
-                "file_name": certificate.file_name,
-                "is_synced": certificate.is_synced,
-                "is_education": certificate.is_education,
-                "tech_type": certificate.tech_type,
-                "reject_reason": certificate.reject_reason,
-                "is_not_has_license_number": certificate.is_not_has_license_number,
-                "created_on": format_datetime(certificate.created_on),
-                "created_by": certificate.created_by,
-                "modified_on": format_datetime(certificate.modified_on),
-                "modified_by": certificate.modified_by
-            }
-            response_data["certificates"].append(certificate_data)
-        
-        # Add language data with nested language information
-        for language_skill in resume.languages:
-            language_data = {
-                "id": language_skill.id,
-                "language_id": language_skill.language_id,
-                "proficiency": language_skill.proficiency,
-                "created_on": format_datetime(language_skill.created_on),
-                "created_by": language_skill.created_by,
-                "modified_on": format_datetime(language_skill.modified_on),
-                "modified_by": language_skill.modified_by,
-                "language": {
-                    "id": language_skill.language.id,
-                    "name": language_skill.language.name,
-                    "created_on": format_datetime(language_skill.language.created_on),
-                    "created_by": language_skill.language.created_by,
-                    "modified_on": format_datetime(language_skill.language.modified_on),
-                    "modified_by": language_skill.language.modified_by
-                }
-            }
-            response_data["languages"].append(language_data)
-        
-        # Add domain data
-        for domain in resume.domains:
-            domain_data = {
-                "id": domain.id,
-                "name": domain.name,
-                "year": domain.year,
-                "month": domain.month,
-                "created_on": format_datetime(domain.created_on),
-                "created_by": domain.created_by,
-                "modified_on": format_datetime(domain.modified_on),
-                "modified_by": domain.modified_by
-            }
-            response_data["domains"].append(domain_data)
-        
-        # Add project data
-        for project in resume.projects:
-            project_data = {
-                "id": project.id,
-                "resume_project_id": project.resume_project_id,
-                "project_id": project.project_id,
-                "name": project.name,
-                "project_key": project.project_key,
-                "project_code": project.project_code,
-                "project_rank": project.project_rank,
-                "project_lead": project.project_lead,
-                "project_category": project.project_category,
-                "customer_code": project.customer_code,
-                "contract_type": project.contract_type,
-                "url": project.url,
-                "company": project.company,
-                "type": project.type,
-                "team_size": project.team_size,
-                "search_skill": project.search_skill,
-                "technology": project.technology,
-                "project_description": project.project_description,
-                "groupname": project.groupname,
-                "status": project.status,
-                "domain": project.domain,
-                "start_date": format_datetime(project.start_date),
-                "end_date": format_datetime(project.end_date),
-                "pain_points": project.pain_points,
-                "key_findings": project.key_findings,
-                "working_process": project.working_process,
-                "responsibility": project.responsibility,
-                "technology_by_pm": project.technology_by_pm,
-                "description_by_pm": project.description_by_pm,
-                "is_update_team": project.is_update_team,
-                "apply_incompleted": project.apply_incompleted,
-                "skill": project.skill,
-                "skill_code": project.skill_code,
-                "seniority": project.seniority,
-                "created_on": format_datetime(project.created_on),
-                "created_by": project.created_by,
-                "modified_on": format_datetime(project.modified_on),
-                "modified_by": project.modified_by
-            }
-            response_data["projects"].append(project_data)
-        
-        # Add professional skills data
-        for skill in resume.professional_skills:
-            skill_data = {
-                "id": skill.id,
-                "job_title_name": skill.job_title_name,
-                "experience_month": skill.experience_month,
-                "experience_year": skill.experience_year,
-                "job_fill_by_user": skill.job_fill_by_user,
-                "is_main_skill": skill.is_main_skill,
-                "project_info": skill.project_info,
-                "created_on": format_datetime(skill.created_on),
-                "created_by": skill.created_by,
-                "modified_on": format_datetime(skill.modified_on),
-                "modified_by": skill.modified_by
-            }
-            response_data["professional_skills"].append(skill_data)
+        response_data = _full_resume(resume)
+        response_data["educations"] = [_full_education(education) for education in resume.educations]
+        response_data["certificates"] = [_full_certificate(certificate) for certificate in resume.certificates]
+        response_data["languages"] = [
+            {**_full_language_skill(language_skill), "language": _full_language(language_skill.language)}
+            for language_skill in resume.languages
+        ]
+        response_data["domains"] = [_full_domain(domain) for domain in resume.domains]
+        response_data["projects"] = [_full_project(project) for project in resume.projects]
+        response_data["professional_skills"] = [_full_professional_skill(skill) for skill in resume.professional_skills]
         
-        return response_data, 200
+        # Encode once and send the bytes as-is, so a cache hit skips both
+        # decoding and re-encoding the document
+        body = encode_json(response_data)
+        cache_set_bytes(key, body, RESUME_FULL_TTL)
+        return current_app.response_class(body, mimetype='application/json')
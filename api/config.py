@@ -1,9 +1,37 @@
 import os
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Threads per gunicorn worker; gunicorn_conf.py reads it from here, and each
+# worker's connection pool is sized to match
+GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', 8))
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'postgresql://username@localhost:5432/interview_api'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Redis for the by-resume list cache; caching is off when unset
+    REDIS_URL = os.environ.get('REDIS_URL')
+    # Serve /swagger/ and /swagger.json; off unless explicitly enabled
+    ENABLE_SWAGGER = os.environ.get('ENABLE_SWAGGER', '').lower() in ('1', 'true')
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        # Batch size for multi-row INSERT ... VALUES used by executemany (bulk endpoints)
+        'insertmanyvalues_page_size': 10000,
+        # One connection per gunicorn thread, plus a little overflow for the
+        # threaded dev server; see gunicorn_conf.py for the per-host total
+        'pool_size': GUNICORN_THREADS,
+        'max_overflow': 2,
+        # Give up on a checkout after this many seconds when the pool is exhausted;
+        # the request then fails fast with a 503 instead of queueing indefinitely
+        'pool_timeout': 10,
+        # No SELECT 1 before each checkout; recycle connections before server-side
+        # idle timeouts instead, and surface dropped connections as 503s
+        'pool_pre_ping': False,
+        'pool_recycle': 1800,
+        # Encode and decode JSONB columns (technology, project_info) with orjson
+        # instead of the stdlib json module
+        'json_serializer': lambda value: orjson.dumps(value).decode(),
+        'json_deserializer': orjson.loads,
+    }
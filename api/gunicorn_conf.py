@@ -0,0 +1,30 @@
+import multiprocessing
+import os
+from config import GUNICORN_THREADS
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Threaded workers so requests blocked on the database overlap instead of
+# queueing. Each worker holds its own SQLAlchemy pool of GUNICORN_THREADS + 2
+# connections (config.py), so workers * (threads + 2) must stay below Postgres'
+# max_connections (100 by default). The default worker count is capped so the
+# defaults use at most 8 * (8 + 2) = 80, leaving room for migrations and
+# scripts; raise WEB_CONCURRENCY or GUNICORN_THREADS only together with it.
+MAX_DEFAULT_WORKERS = 8
+
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, MAX_DEFAULT_WORKERS)))
+threads = GUNICORN_THREADS
+
+# Import the app once in the master so workers share its pages copy-on-write
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Drop any connections opened while preloading so workers never share a socket"""
+    from app import db
+    from run import app
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
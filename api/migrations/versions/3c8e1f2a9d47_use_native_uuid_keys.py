@@ -0,0 +1,81 @@
+"""Use native UUID primary and foreign keys
+
+Revision ID: 3c8e1f2a9d47
+Revises: 94587e0b5a42
+Create Date: 2025-08-02 14:06:31.482915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3c8e1f2a9d47'
+down_revision = '94587e0b5a42'
+branch_labels = None
+depends_on = None
+
+TABLES = ['resume', 'languages', 'education', 'certificates', 'language_skills',
+          'domains', 'projects', 'professional_skills']
+
+# (table, column, referenced table)
+FOREIGN_KEYS = [
+    ('education', 'resume_id', 'resume'),
+    ('certificates', 'resume_id', 'resume'),
+    ('language_skills', 'resume_id', 'resume'),
+    ('language_skills', 'language_id', 'languages'),
+    ('domains', 'resume_id', 'resume'),
+    ('projects', 'resume_id', 'resume'),
+    ('professional_skills', 'resume_id', 'resume'),
+]
+
+
+def _drop_foreign_keys():
+    for table, column, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+
+
+def _create_foreign_keys():
+    for table, column, referent in FOREIGN_KEYS:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referent, [column], ['id'])
+
+
+def upgrade():
+    _drop_foreign_keys()
+
+    for table in TABLES:
+        op.alter_column(table, 'id',
+                        existing_type=sa.String(length=36),
+                        type_=postgresql.UUID(as_uuid=True),
+                        postgresql_using='id::uuid',
+                        server_default=sa.text('gen_random_uuid()'))
+
+    for table, column, _ in FOREIGN_KEYS:
+        op.alter_column(table, column,
+                        existing_type=sa.String(length=36),
+                        type_=postgresql.UUID(as_uuid=True),
+                        postgresql_using=f'{column}::uuid',
+                        existing_nullable=False)
+
+    _create_foreign_keys()
+
+
+def downgrade():
+    _drop_foreign_keys()
+
+    for table, column, _ in FOREIGN_KEYS:
+        op.alter_column(table, column,
+                        existing_type=postgresql.UUID(as_uuid=True),
+                        type_=sa.String(length=36),
+                        postgresql_using=f'{column}::text',
+                        existing_nullable=False)
+
+    for table in TABLES:
+        op.alter_column(table, 'id',
+                        existing_type=postgresql.UUID(as_uuid=True),
+                        type_=sa.String(length=36),
+                        postgresql_using='id::text',
+                        server_default=None)
+
+    _create_foreign_keys()
@@ -0,0 +1,33 @@
+"""Index resume children by (resume_id, id)
+
+Revision ID: 4b9e2f7c3a16
+Revises: e6b3a0d4c815
+Create Date: 2025-08-05 09:31:52.640218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b9e2f7c3a16'
+down_revision = 'e6b3a0d4c815'
+branch_labels = None
+depends_on = None
+
+TABLES = ['education', 'certificates', 'language_skills', 'domains', 'projects',
+          'professional_skills']
+
+
+def upgrade():
+    # The composite index serves by-resume lists ordered or paged by id, and
+    # still covers resume_id lookups for the ON DELETE CASCADE foreign keys
+    for table in TABLES:
+        op.create_index(f'ix_{table}_resume_id_id', table, ['resume_id', 'id'], unique=False)
+        op.drop_index(f'ix_{table}_resume_id', table_name=table)
+
+
+def downgrade():
+    for table in TABLES:
+        op.create_index(f'ix_{table}_resume_id', table, ['resume_id'], unique=False)
+        op.drop_index(f'ix_{table}_resume_id_id', table_name=table)
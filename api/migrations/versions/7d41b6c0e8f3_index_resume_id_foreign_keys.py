@@ -0,0 +1,29 @@
+"""Index resume_id foreign keys
+
+Revision ID: 7d41b6c0e8f3
+Revises: 3c8e1f2a9d47
+Create Date: 2025-08-02 15:21:09.337102
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d41b6c0e8f3'
+down_revision = '3c8e1f2a9d47'
+branch_labels = None
+depends_on = None
+
+TABLES = ['education', 'certificates', 'language_skills', 'domains', 'projects',
+          'professional_skills']
+
+
+def upgrade():
+    for table in TABLES:
+        op.create_index(f'ix_{table}_resume_id', table, ['resume_id'], unique=False)
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_resume_id', table_name=table)
@@ -0,0 +1,35 @@
+"""Server-side defaults for audit timestamps
+
+Revision ID: a5f09c3d1b72
+Revises: 7d41b6c0e8f3
+Create Date: 2025-08-03 10:12:44.580216
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5f09c3d1b72'
+down_revision = '7d41b6c0e8f3'
+branch_labels = None
+depends_on = None
+
+TABLES = ['resume', 'languages', 'education', 'certificates', 'language_skills',
+          'domains', 'projects', 'professional_skills']
+
+
+def upgrade():
+    for table in TABLES:
+        for column in ('created_on', 'modified_on'):
+            op.alter_column(table, column,
+                            existing_type=sa.DateTime(),
+                            server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade():
+    for table in TABLES:
+        for column in ('created_on', 'modified_on'):
+            op.alter_column(table, column,
+                            existing_type=sa.DateTime(),
+                            server_default=None)
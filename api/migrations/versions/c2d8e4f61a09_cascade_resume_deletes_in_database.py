@@ -0,0 +1,34 @@
+"""Cascade resume deletes in the database
+
+Revision ID: c2d8e4f61a09
+Revises: a5f09c3d1b72
+Create Date: 2025-08-03 16:40:27.915338
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2d8e4f61a09'
+down_revision = 'a5f09c3d1b72'
+branch_labels = None
+depends_on = None
+
+TABLES = ['education', 'certificates', 'language_skills', 'domains', 'projects',
+          'professional_skills']
+
+
+def _recreate_resume_foreign_keys(ondelete):
+    for table in TABLES:
+        name = f'{table}_resume_id_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'resume', ['resume_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate_resume_foreign_keys('CASCADE')
+
+
+def downgrade():
+    _recreate_resume_foreign_keys(None)
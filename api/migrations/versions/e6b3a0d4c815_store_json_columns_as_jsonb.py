@@ -0,0 +1,42 @@
+"""Store JSON columns as JSONB with GIN indexes
+
+Revision ID: e6b3a0d4c815
+Revises: c2d8e4f61a09
+Create Date: 2025-08-04 10:12:48.206571
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b3a0d4c815'
+down_revision = 'c2d8e4f61a09'
+branch_labels = None
+depends_on = None
+
+# (table, column)
+JSON_COLUMNS = [
+    ('projects', 'technology'),
+    ('professional_skills', 'project_info'),
+]
+
+
+def upgrade():
+    for table, column in JSON_COLUMNS:
+        op.alter_column(table, column,
+                        existing_type=sa.JSON(),
+                        type_=postgresql.JSONB(),
+                        postgresql_using=f'{column}::jsonb')
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False,
+                        postgresql_using='gin')
+
+
+def downgrade():
+    for table, column in JSON_COLUMNS:
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+        op.alter_column(table, column,
+                        existing_type=postgresql.JSONB(),
+                        type_=sa.JSON(),
+                        postgresql_using=f'{column}::json')
@@ -1,3 +1,4 @@
+import os
 from app import create_app, db
 
 app = create_app()
@@ -15,4 +16,5 @@ def seed_db():
     create_sample_data()
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5001)
+    # Development server only; deployments run gunicorn -c gunicorn_conf.py run:app
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=int(os.environ.get('PORT', 5001)), threaded=True)
@@ -9,44 +9,70 @@ from app.models import (
     Domain, Project, ProfessionalSkill
 )
 from datetime import datetime, timedelta
+from itertools import islice
+from sqlalchemy import delete, func, insert, select, text
 import uuid
 
 app = create_app()
 
+# Every seeded model, children before the tables they reference
+SEED_MODELS = (ProfessionalSkill, Project, Domain, LanguageSkill, Language, Certificate, Education, Resume)
+
+# Rows per executemany INSERT; larger inputs are consumed from their iterator in slices
+SEED_BATCH_SIZE = 10_000
+
+def insert_rows(conn, model, rows):
+    """Insert an iterable of rows in SEED_BATCH_SIZE batches, holding one batch at a time"""
+    rows = iter(rows)
+    while batch := list(islice(rows, SEED_BATCH_SIZE)):
+        conn.execute(insert(model), batch)
+
+def insert_with_ids(conn, model, rows):
+    """Insert rows with client-generated UUIDs and return the IDs, in order, for child rows"""
+    ids = [uuid.uuid4() for _ in rows]
+    insert_rows(conn, model, ({**row, "id": id_} for row, id_ in zip(rows, ids)))
+    return ids
+
+def _verify_counts(conn):
+    """Count the rows now in every seeded table with a single query"""
+    row = conn.execute(
+        select(*(select(func.count()).select_from(model).scalar_subquery() for model in SEED_MODELS))
+    ).one()
+    return dict(zip(SEED_MODELS, row))
+
 def create_sample_data():
     """Create comprehensive sample data for all models"""
     
     print("Creating sample data...")
     
-    with app.app_context():
+    # A plain Core connection: the seed only runs INSERTs, so it skips the ORM
+    # session entirely. One transaction covers the whole seed; it commits when
+    # the block exits and rolls back if anything inside raises.
+    with app.app_context(), db.engine.begin() as conn:
         # Clear existing data
         print("Clearing existing data...")
-        db.session.query(ProfessionalSkill).delete()
-        db.session.query(Project).delete()
-        db.session.query(Domain).delete()
-        db.session.query(LanguageSkill).delete()
-        db.session.query(Language).delete()
-        db.session.query(Certificate).delete()
-        db.session.query(Education).delete()
-        db.session.query(Resume).delete()
-        db.session.commit()
+        if db.engine.dialect.name == "postgresql":
+            # One statement that frees the tables' pages instead of deleting row by row
+            tables = ", ".join(model.__tablename__ for model in SEED_MODELS)
+            conn.execute(text(f"TRUNCATE TABLE {tables} CASCADE"))
+        else:
+            for model in SEED_MODELS:
+                conn.execute(delete(model))
         
         # Create Languages first (referenced by LanguageSkill)
         print("Creating languages...")
-        languages = [
-            Language(name="English"),
-            Language(name="Spanish"),
-            Language(name="French"),
-            Language(name="German"),
-            Language(name="Mandarin"),
-            Language(name="Japanese"),
-            Language(name="Portuguese"),
-            Language(name="Russian")
+        languages_data = [
+            {"name": "English"},
+            {"name": "Spanish"},
+            {"name": "French"},
+            {"name": "German"},
+            {"name": "Mandarin"},
+            {"name": "Japanese"},
+            {"name": "Portuguese"},
+            {"name": "Russian"}
         ]
         
-        for lang in languages:
-            db.session.add(lang)
-        db.session.commit()
+        language_ids = insert_with_ids(conn, Language, languages_data)
         
         # Create Resumes
         print("Creating resumes...")
@@ -93,18 +119,13 @@ def create_sample_data():
             }
         ]
         
-        resumes = []
-        for resume_data in resumes_data:
-            resume = Resume(**resume_data)
-            db.session.add(resume)
-            resumes.append(resume)
-        db.session.commit()
+        resume_ids = insert_with_ids(conn, Resume, resumes_data)
         
         # Create Education records
         print("Creating education records...")
         education_data = [
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "school": "Massachusetts Institute of Technology",
                 "degree": "Master of Science",
                 "major": "Computer Science",
@@ -115,7 +136,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "school": "University of California, Berkeley",
                 "degree": "Bachelor of Science",
                 "major": "Computer Engineering",
@@ -126,7 +147,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[1],
+                "resume_id": resume_ids[1],
                 "school": "Stanford University",
                 "degree": "Master of Business Administration",
                 "major": "Technology Management",
@@ -137,7 +158,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[1],
+                "resume_id": resume_ids[1],
                 "school": "University of Washington",
                 "degree": "Bachelor of Science",
                 "major": "Information Systems",
@@ -148,7 +169,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[2],
+                "resume_id": resume_ids[2],
                 "school": "Carnegie Mellon University",
                 "degree": "Bachelor of Science",
                 "major": "Software Engineering",
@@ -160,26 +181,13 @@ def create_sample_data():
             }
         ]
         
-        for edu_data in education_data:
-            education = Education(
-                resume_id=edu_data["resume"].id,
-                school=edu_data["school"],
-                degree=edu_data["degree"],
-                major=edu_data["major"],
-                start=edu_data["start"],
-                end=edu_data["end"],
-                grade=edu_data["grade"],
-                complete_degree=edu_data["complete_degree"],
-                created_by=edu_data["created_by"]
-            )
-            db.session.add(education)
-        db.session.commit()
+        insert_rows(conn, Education, education_data)
         
         # Create Certificates
         print("Creating certificates...")
         certificates_data = [
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "certificate": "AWS Certified Solutions Architect",
                 "certificate_authority": "Amazon Web Services",
                 "not_expired": True,
@@ -190,7 +198,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "certificate": "Certified Kubernetes Administrator",
                 "certificate_authority": "Cloud Native Computing Foundation",
                 "not_expired": True,
@@ -201,7 +209,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[1],
+                "resume_id": resume_ids[1],
                 "certificate": "Google Cloud Professional Data Engineer",
                 "certificate_authority": "Google",
                 "not_expired": True,
@@ -212,7 +220,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[2],
+                "resume_id": resume_ids[2],
                 "certificate": "Microsoft Azure Developer Associate",
                 "certificate_authority": "Microsoft",
                 "not_expired": True,
@@ -223,7 +231,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[3],
+                "resume_id": resume_ids[3],
                 "certificate": "Certified Scrum Master",
                 "certificate_authority": "Scrum Alliance",
                 "not_expired": True,
@@ -235,78 +243,58 @@ def create_sample_data():
             }
         ]
         
-        for cert_data in certificates_data:
-            certificate = Certificate(
-                resume_id=cert_data["resume"].id,
-                certificate=cert_data["certificate"],
-                certificate_authority=cert_data["certificate_authority"],
-                not_expired=cert_data["not_expired"],
-                issue_date=cert_data["issue_date"],
-                provider=cert_data["provider"],
-                field=cert_data["field"],
-                level=cert_data["level"],
-                created_by=cert_data["created_by"]
-            )
-            db.session.add(certificate)
-        db.session.commit()
+        insert_rows(conn, Certificate, certificates_data)
         
         # Create Language Skills
         print("Creating language skills...")
-        language_skills_data = [
-            {"resume": resumes[0], "language": languages[0], "proficiency": 5},  # English - Native
-            {"resume": resumes[0], "language": languages[1], "proficiency": 4},  # Spanish - Fluent
-            {"resume": resumes[0], "language": languages[2], "proficiency": 3},  # French - Intermediate
-            {"resume": resumes[1], "language": languages[0], "proficiency": 5},  # English - Native
-            {"resume": resumes[1], "language": languages[4], "proficiency": 3},  # Mandarin - Intermediate
-            {"resume": resumes[2], "language": languages[0], "proficiency": 5},  # English - Native
-            {"resume": resumes[2], "language": languages[3], "proficiency": 4},  # German - Fluent
-            {"resume": resumes[3], "language": languages[0], "proficiency": 5},  # English - Native
-            {"resume": resumes[3], "language": languages[5], "proficiency": 3},  # Japanese - Intermediate
-            {"resume": resumes[4], "language": languages[0], "proficiency": 5},  # English - Native
-            {"resume": resumes[4], "language": languages[6], "proficiency": 4},  # Portuguese - Fluent
+        # (resume index, language index, proficiency)
+        language_skill_pairs = [
+            (0, 0, 5),  # English - Native
+            (0, 1, 4),  # Spanish - Fluent
+            (0, 2, 3),  # French - Intermediate
+            (1, 0, 5),  # English - Native
+            (1, 4, 3),  # Mandarin - Intermediate
+            (2, 0, 5),  # English - Native
+            (2, 3, 4),  # German - Fluent
+            (3, 0, 5),  # English - Native
+            (3, 5, 3),  # Japanese - Intermediate
+            (4, 0, 5),  # English - Native
+            (4, 6, 4),  # Portuguese - Fluent
         ]
+        language_skills_data = (
+            {"resume_id": resume_ids[r], "language_id": language_ids[l], "proficiency": p, "created_by": "admin"}
+            for r, l, p in language_skill_pairs
+        )
         
-        for lang_skill_data in language_skills_data:
-            lang_skill = LanguageSkill(
-                resume_id=lang_skill_data["resume"].id,
-                language_id=lang_skill_data["language"].id,
-                proficiency=lang_skill_data["proficiency"],
-                created_by="admin"
-            )
-            db.session.add(lang_skill)
-        db.session.commit()
+        insert_rows(conn, LanguageSkill, language_skills_data)
         
         # Create Domain Experience
         print("Creating domain experience...")
-        domains_data = [
-            {"resume": resumes[0], "name": "Financial Technology", "year": 3, "month": 6},
-            {"resume": resumes[0], "name": "E-commerce", "year": 2, "month": 0},
-            {"resume": resumes[1], "name": "Healthcare Technology", "year": 4, "month": 3},
-            {"resume": resumes[1], "name": "Data Analytics", "year": 3, "month": 0},
-            {"resume": resumes[2], "name": "Gaming", "year": 2, "month": 8},
-            {"resume": resumes[2], "name": "Mobile Applications", "year": 3, "month": 0},
-            {"resume": resumes[3], "name": "Enterprise Software", "year": 5, "month": 0},
-            {"resume": resumes[3], "name": "DevOps", "year": 2, "month": 6},
-            {"resume": resumes[4], "name": "Artificial Intelligence", "year": 1, "month": 10},
-            {"resume": resumes[4], "name": "Machine Learning", "year": 2, "month": 4},
+        # (resume index, domain, years, months)
+        domain_rows = [
+            (0, "Financial Technology", 3, 6),
+            (0, "E-commerce", 2, 0),
+            (1, "Healthcare Technology", 4, 3),
+            (1, "Data Analytics", 3, 0),
+            (2, "Gaming", 2, 8),
+            (2, "Mobile Applications", 3, 0),
+            (3, "Enterprise Software", 5, 0),
+            (3, "DevOps", 2, 6),
+            (4, "Artificial Intelligence", 1, 10),
+            (4, "Machine Learning", 2, 4),
         ]
+        domains_data = (
+            {"resume_id": resume_ids[r], "name": name, "year": year, "month": month, "created_by": "admin"}
+            for r, name, year, month in domain_rows
+        )
         
-        for domain_data in domains_data:
-            domain = Domain(
-                resume_id=domain_data["resume"].id,
-                name=domain_data["name"],
-                year=domain_data["year"],
-                month=domain_data["month"],
-                created_by="admin"
-            )
-            db.session.add(domain)
-        db.session.commit()
+        insert_rows(conn, Domain, domains_data)
         
         # Create Projects
         print("Creating projects...")
         projects_data = [
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "name": "Banking Payment System",
                 "project_category": "Development",
                 "company": "FinTech Solutions Inc",
@@ -324,7 +312,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "name": "E-commerce Platform Modernization",
                 "project_category": "Maintenance",
                 "company": "ShopTech Corp",
@@ -342,7 +330,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[1],
+                "resume_id": resume_ids[1],
                 "name": "Healthcare Data Analytics Platform",
                 "project_category": "Development",
                 "company": "MedTech Innovations",
@@ -360,7 +348,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[2],
+                "resume_id": resume_ids[2],
                 "name": "Mobile Gaming Platform",
                 "project_category": "Development",
                 "company": "GameStudio Pro",
@@ -378,7 +366,7 @@ def create_sample_data():
                 "created_by": "admin"
             },
             {
-                "resume": resumes[3],
+                "resume_id": resume_ids[3],
                 "name": "Enterprise Resource Planning System",
                 "project_category": "Development",
                 "company": "Enterprise Solutions Ltd",
@@ -397,33 +385,13 @@ def create_sample_data():
             }
         ]
         
-        for project_data in projects_data:
-            project = Project(
-                resume_id=project_data["resume"].id,
-                name=project_data["name"],
-                project_category=project_data["project_category"],
-                company=project_data["company"],
-                type=project_data["type"],
-                team_size=project_data["team_size"],
-                technology=project_data["technology"],
-                project_description=project_data["project_description"],
-                status=project_data["status"],
-                domain=project_data["domain"],
-                start_date=project_data["start_date"],
-                end_date=project_data["end_date"],
-                responsibility=project_data["responsibility"],
-                skill=project_data["skill"],
-                seniority=project_data["seniority"],
-                created_by=project_data["created_by"]
-            )
-            db.session.add(project)
-        db.session.commit()
+        insert_rows(conn, Project, projects_data)
         
         # Create Professional Skills
         print("Creating professional skills...")
         skills_data = [
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "job_title_name": "Java Developer",
                 "experience_year": 5,
                 "experience_month": 6,
@@ -434,7 +402,7 @@ def create_sample_data():
                 ]
             },
             {
-                "resume": resumes[0],
+                "resume_id": resume_ids[0],
                 "job_title_name": "Python Developer",
                 "experience_year": 3,
                 "experience_month": 0,
@@ -444,7 +412,7 @@ def create_sample_data():
                 ]
             },
             {
-                "resume": resumes[1],
+                "resume_id": resume_ids[1],
                 "job_title_name": "Data Engineer",
                 "experience_year": 4,
                 "experience_month": 3,
@@ -454,7 +422,7 @@ def create_sample_data():
                 ]
             },
             {
-                "resume": resumes[1],
+                "resume_id": resume_ids[1],
                 "job_title_name": "Machine Learning Engineer",
                 "experience_year": 2,
                 "experience_month": 8,
@@ -464,7 +432,7 @@ def create_sample_data():
                 ]
             },
             {
-                "resume": resumes[2],
+                "resume_id": resume_ids[2],
                 "job_title_name": "Unity Developer",
                 "experience_year": 3,
                 "experience_month": 4,
@@ -474,7 +442,7 @@ def create_sample_data():
                 ]
             },
             {
-                "resume": resumes[3],
+                "resume_id": resume_ids[3],
                 "job_title_name": "Java Architect",
                 "experience_year": 6,
                 "experience_month": 0,
@@ -484,7 +452,7 @@ def create_sample_data():
                 ]
             },
             {
-                "resume": resumes[4],
+                "resume_id": resume_ids[4],
                 "job_title_name": "AI Research Engineer",
                 "experience_year": 2,
                 "experience_month": 6,
@@ -495,29 +463,19 @@ def create_sample_data():
             }
         ]
         
-        for skill_data in skills_data:
-            skill = ProfessionalSkill(
-                resume_id=skill_data["resume"].id,
-                job_title_name=skill_data["job_title_name"],
-                experience_year=skill_data["experience_year"],
-                experience_month=skill_data["experience_month"],
-                is_main_skill=skill_data["is_main_skill"],
-                project_info=skill_data["project_info"],
-                created_by="admin"
-            )
-            db.session.add(skill)
-        db.session.commit()
+        insert_rows(conn, ProfessionalSkill, ({**row, "created_by": "admin"} for row in skills_data))
         
+        counts = _verify_counts(conn)
         print("Sample data creation completed successfully!")
         print(f"Created:")
-        print(f"  - {len(resumes)} resumes")
-        print(f"  - {len(languages)} languages")
-        print(f"  - {len(education_data)} education records")
-        print(f"  - {len(certificates_data)} certificates")
-        print(f"  - {len(language_skills_data)} language skills")
-        print(f"  - {len(domains_data)} domain experiences")
-        print(f"  - {len(projects_data)} projects")
-        print(f"  - {len(skills_data)} professional skills")
+        print(f"  - {counts[Resume]} resumes")
+        print(f"  - {counts[Language]} languages")
+        print(f"  - {counts[Education]} education records")
+        print(f"  - {counts[Certificate]} certificates")
+        print(f"  - {counts[LanguageSkill]} language skills")
+        print(f"  - {counts[Domain]} domain experiences")
+        print(f"  - {counts[Project]} projects")
+        print(f"  - {counts[ProfessionalSkill]} professional skills")
 
 if __name__ == "__main__":
     create_sample_data()
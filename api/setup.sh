@@ -41,4 +41,4 @@ echo "To start the server, run:"
 echo "source venv/bin/activate && python run.py"
 echo ""
 echo "API will be available at: http://localhost:5000"
-echo "Swagger documentation at: http://localhost:5000/swagger/"
+echo "Swagger documentation at: http://localhost:5000/swagger/ (set ENABLE_SWAGGER=true)"
@@ -3,12 +3,35 @@ Simple test examples for the Interview Co-Pilot API
 Run these after starting the server with: python run.py
 """
 
+import os
+import orjson
 import requests
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 BASE_URL = "http://localhost:5000"
 
+# One keep-alive connection per thread instead of a new TCP connection for each call;
+# requests.Session is not thread-safe, so the tests run side by side each get their own.
+# Gateway errors and the API's 503 "Database busy" are retried with a short backoff,
+# honouring Retry-After; urllib3 does not retry POSTs, so nothing is created twice.
+_local = threading.local()
+
+def session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.session.mount("http://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False),
+        ))
+        # Payloads are sent pre-encoded with orjson, which also writes the datetimes as ISO 8601
+        _local.session.headers["Content-Type"] = "application/json"
+    return _local.session
+
 def test_resume_crud():
     print("Testing Resume CRUD operations...")
     
@@ -19,7 +42,7 @@ def test_resume_crud():
         "created_by": "admin"
     }
     
-    response = requests.post(f"{BASE_URL}/resumes/", json=resume_data)
+    response = session().post(f"{BASE_URL}/resumes/", data=orjson.dumps(resume_data))
     print(f"Create Resume: {response.status_code}")
     
     if response.status_code == 201:
@@ -28,7 +51,7 @@ def test_resume_crud():
         print(f"Created Resume ID: {resume_id}")
         
         # Get the resume
-        response = requests.get(f"{BASE_URL}/resumes/{resume_id}")
+        response = session().get(f"{BASE_URL}/resumes/{resume_id}")
         print(f"Get Resume: {response.status_code}")
         
         # Update the resume
@@ -37,7 +60,7 @@ def test_resume_crud():
             "last_name": "Smith",
             "modified_by": "admin"
         }
-        response = requests.put(f"{BASE_URL}/resumes/{resume_id}", json=update_data)
+        response = session().put(f"{BASE_URL}/resumes/{resume_id}", data=orjson.dumps(update_data))
         print(f"Update Resume: {response.status_code}")
         
         # Test education for this resume
@@ -55,14 +78,14 @@ def test_education_crud(resume_id):
         "school": "University of Technology",
         "degree": "Bachelor of Science",
         "major": "Computer Science",
-        "start": "2018-09-01T00:00:00",
-        "end": "2022-06-30T00:00:00",
+        "start": datetime(2018, 9, 1),
+        "end": datetime(2022, 6, 30),
         "grade": "3.8",
         "complete_degree": True,
         "created_by": "admin"
     }
     
-    response = requests.post(f"{BASE_URL}/education/", json=education_data)
+    response = session().post(f"{BASE_URL}/education/", data=orjson.dumps(education_data))
     print(f"Create Education: {response.status_code}")
     
     if response.status_code == 201:
@@ -71,7 +94,7 @@ def test_education_crud(resume_id):
         print(f"Created Education ID: {education_id}")
         
         # Get education by resume
-        response = requests.get(f"{BASE_URL}/education/resume/{resume_id}")
+        response = session().get(f"{BASE_URL}/education/resume/{resume_id}")
         print(f"Get Education by Resume: {response.status_code}")
         if response.status_code == 200:
             print(f"Education records found: {len(response.json())}")
@@ -84,14 +107,14 @@ def test_certificate_crud(resume_id):
         "certificate": "AWS Certified Solutions Architect",
         "certificate_authority": "Amazon Web Services",
         "not_expired": True,
-        "issue_date": "2023-01-15T00:00:00",
+        "issue_date": datetime(2023, 1, 15),
         "provider": "AWS",
         "field": "Cloud Computing",
         "level": "Associate",
         "created_by": "admin"
     }
     
-    response = requests.post(f"{BASE_URL}/certificates/", json=certificate_data)
+    response = session().post(f"{BASE_URL}/certificates/", data=orjson.dumps(certificate_data))
     print(f"Create Certificate: {response.status_code}")
     
     if response.status_code == 201:
@@ -107,7 +130,7 @@ def test_language_crud(resume_id):
         "created_by": "admin"
     }
     
-    response = requests.post(f"{BASE_URL}/languages/", json=language_data)
+    response = session().post(f"{BASE_URL}/languages/", data=orjson.dumps(language_data))
     print(f"Create Language: {response.status_code}")
     
     if response.status_code == 201:
@@ -122,8 +145,22 @@ def test_language_crud(resume_id):
             "created_by": "admin"
         }
         
-        response = requests.post(f"{BASE_URL}/languages/skills", json=skill_data)
+        response = session().post(f"{BASE_URL}/languages/skills", data=orjson.dumps(skill_data))
         print(f"Create Language Skill: {response.status_code}")
+        
+        if response.status_code == 201:
+            skill_id = response.json()['id']
+            
+            # Switch the skill to another language; the nested language must follow
+            response = session().post(f"{BASE_URL}/languages/", data=orjson.dumps({"name": "Spanish", "created_by": "admin"}))
+            other_language_id = response.json()['id']
+            response = session().put(f"{BASE_URL}/languages/skills/{skill_id}",
+                                   data=orjson.dumps({"language_id": other_language_id, "modified_by": "admin"}))
+            print(f"Update Language Skill: {response.status_code}")
+            skill = response.json()
+            assert skill['language_id'] == other_language_id, skill
+            assert skill['language']['id'] == other_language_id, skill
+            assert skill['language']['name'] == "Spanish", skill
 
 def test_project_crud(resume_id):
     print("Testing Project CRUD operations...")
@@ -139,15 +176,15 @@ def test_project_crud(resume_id):
         "project_description": "Developed a full-stack e-commerce platform",
         "status": "Completed",
         "domain": "E-commerce",
-        "start_date": "2023-01-01T00:00:00",
-        "end_date": "2023-06-30T00:00:00",
+        "start_date": datetime(2023, 1, 1),
+        "end_date": datetime(2023, 6, 30),
         "responsibility": "Backend development and API design",
         "skill": "Python Developer",
         "seniority": "Senior",
         "created_by": "admin"
     }
     
-    response = requests.post(f"{BASE_URL}/projects/", json=project_data)
+    response = session().post(f"{BASE_URL}/projects/", data=orjson.dumps(project_data))
     print(f"Create Project: {response.status_code}")
     
     if response.status_code == 201:
@@ -167,13 +204,38 @@ def test_professional_skill_crud(resume_id):
         "created_by": "admin"
     }
     
-    response = requests.post(f"{BASE_URL}/professional-skills/", json=skill_data)
+    response = session().post(f"{BASE_URL}/professional-skills/", data=orjson.dumps(skill_data))
     print(f"Create Professional Skill: {response.status_code}")
     
     if response.status_code == 201:
         skill = response.json()
         print(f"Created Professional Skill ID: {skill['id']}")
 
+def test_pagination_errors():
+    print("Testing pagination argument validation...")
+    
+    # A bad cursor or page size must be rejected, not answered with the first page
+    for query in ("after_id=not-a-uuid", "limit=abc", "limit=-1", "limit=0", "offset=-5"):
+        response = session().get(f"{BASE_URL}/resumes/?{query}")
+        print(f"List Resumes ?{query}: {response.status_code}")
+        assert response.status_code == 400, response.text
+
+def test_bulk_errors(resume_id):
+    print("Testing bulk item validation...")
+    
+    # A bad item must be reported by index, and nothing in the batch inserted
+    items = [{"resume_id": resume_id, "name": "Banking", "year": 2}, {"resume_id": resume_id}]
+    response = session().post(f"{BASE_URL}/domains/bulk", data=orjson.dumps(items))
+    print(f"Bulk Create Domains (missing name): {response.status_code}")
+    assert response.status_code == 400, response.text
+    assert "Item 1" in response.json()["message"], response.text
+    
+    items = [{"resume_id": resume_id, "school": "S", "degree": "D", "major": "M", "start": "not-a-date"}]
+    response = session().post(f"{BASE_URL}/education/bulk", data=orjson.dumps(items))
+    print(f"Bulk Create Education (bad date): {response.status_code}")
+    assert response.status_code == 400, response.text
+    assert "Item 0" in response.json()["message"], response.text
+
 def main():
     print("Starting API tests...")
     print("Make sure the server is running on http://localhost:5000")
@@ -181,20 +243,26 @@ def main():
     
     try:
         # Test if server is running
-        response = requests.get(f"{BASE_URL}/")
+        response = session().get(f"{BASE_URL}/")
         print(f"Server status: {response.status_code}")
         
+        test_pagination_errors()
+        
         resume_id = test_resume_crud()
         
         if resume_id:
-            test_certificate_crud(resume_id)
-            test_language_crud(resume_id)
-            test_project_crud(resume_id)
-            test_professional_skill_crud(resume_id)
+            # These only depend on the resume, so run them side by side
+            tests = (test_certificate_crud, test_language_crud, test_project_crud, test_professional_skill_crud, test_bulk_errors)
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = [executor.submit(test, resume_id) for test in tests]
+            for future in futures:
+                future.result()
             
             print("=" * 50)
             print("All tests completed!")
-            print(f"Check Swagger documentation at: {BASE_URL}/swagger/")
+            # The server only serves Swagger when started with ENABLE_SWAGGER
+            if os.environ.get("ENABLE_SWAGGER", "").lower() in ("1", "true"):
+                print(f"Check Swagger documentation at: {BASE_URL}/swagger/")
         
     except requests.exceptions.ConnectionError:
         print("Error: Could not connect to the server.")
@@ -2,13 +2,17 @@
 Configuration utilities for OpenAI and other services
 """
 
+import copy
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables with explicit path
-load_dotenv(dotenv_path=".env.local")
+import _env_bootstrap  # noqa: F401  loads .env.local
+
+# Official OpenAI endpoint; other base URLs are passed to clients explicitly
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 
 
 class OpenAIConfig:
@@ -17,7 +21,7 @@ class OpenAIConfig:
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.embeddings_api_key = os.getenv("OPENAI_EMBEDDINGS_API_KEY", self.api_key)
-        self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+        self.base_url = os.getenv("OPENAI_BASE_URL", DEFAULT_OPENAI_BASE_URL)
         self.embeddings_base_url = os.getenv(
             "OPENAI_EMBEDDINGS_BASE_URL", self.base_url
         )
@@ -27,14 +31,14 @@ class OpenAIConfig:
         )
         self.temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
 
-    def get_chatgpt_config(self) -> Dict[str, Any]:
-        """Get configuration for ChatOpenAI."""
-        config = {"model": self.model_name, "temperature": self.temperature}
+    def get_chatgpt_config(self, model: Optional[str] = None) -> Dict[str, Any]:
+        """Get configuration for ChatOpenAI, optionally for a model other than model_name."""
+        config = {"model": model or self.model_name, "temperature": self.temperature}
 
         if self.api_key:
             config["openai_api_key"] = self.api_key
 
-        if self.base_url and self.base_url != "https://api.openai.com/v1":
+        if self.base_url and self.base_url != DEFAULT_OPENAI_BASE_URL:
             config["openai_api_base"] = self.base_url
 
         return config
@@ -48,7 +52,7 @@ class OpenAIConfig:
 
         if (
             self.embeddings_base_url
-            and self.embeddings_base_url != "https://api.openai.com/v1"
+            and self.embeddings_base_url != DEFAULT_OPENAI_BASE_URL
         ):
             config["openai_api_base"] = self.embeddings_base_url
 
@@ -79,31 +83,45 @@ class OpenAIConfig:
         return None
 
 
-def get_openai_config() -> OpenAIConfig:
-    """Get OpenAI configuration instance."""
+@lru_cache(maxsize=1)
+def _load_openai_config() -> OpenAIConfig:
+    """Read the OpenAI configuration from the environment once per process."""
     return OpenAIConfig()
 
 
-# Example usage configurations for common providers
-COMMON_CONFIGS = {
-    "openai": {
-        "base_url": "https://api.openai.com/v1",
-        "description": "Official OpenAI API",
-    },
-    "azure": {
-        "base_url": "https://your-resource.openai.azure.com/openai/deployments/your-deployment",
-        "description": "Azure OpenAI Service",
-    },
-    "local": {
-        "base_url": "http://localhost:8000/v1",
-        "description": "Local OpenAI-compatible server",
-    },
-    "ollama": {
-        "base_url": "http://localhost:11434/v1",
-        "description": "Ollama local server",
-    },
-    "vllm": {"base_url": "http://localhost:8000/v1", "description": "vLLM server"},
-}
+def get_openai_config() -> OpenAIConfig:
+    """Get an OpenAI configuration instance.
+
+    The environment is only read on the first call; each caller gets its own
+    copy, so changing one instance does not affect the others. Call
+    _load_openai_config.cache_clear() to pick up changed environment variables.
+    """
+    return copy.copy(_load_openai_config())
+
+
+# Example usage configurations for common providers (read-only)
+COMMON_CONFIGS = MappingProxyType({
+    name: MappingProxyType(provider)
+    for name, provider in {
+        "openai": {
+            "base_url": DEFAULT_OPENAI_BASE_URL,
+            "description": "Official OpenAI API",
+        },
+        "azure": {
+            "base_url": "https://your-resource.openai.azure.com/openai/deployments/your-deployment",
+            "description": "Azure OpenAI Service",
+        },
+        "local": {
+            "base_url": "http://localhost:8000/v1",
+            "description": "Local OpenAI-compatible server",
+        },
+        "ollama": {
+            "base_url": "http://localhost:11434/v1",
+            "description": "Ollama local server",
+        },
+        "vllm": {"base_url": "http://localhost:8000/v1", "description": "vLLM server"},
+    }.items()
+})
 
 test_jd = """Responsibilities:
 Coding and Development:
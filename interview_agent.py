@@ -9,9 +9,7 @@ import json
 import os
 from datetime import datetime
 from typing import Dict, Any, Optional
-import wave
 
-from dotenv import load_dotenv
 from livekit.agents import (
     Agent,
     AgentSession,
@@ -34,8 +32,8 @@ from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
 from rag_system import initialize_rag_system
 from interview_workflow import create_interview_workflow, InterviewState
+import _env_bootstrap  # noqa: F401  loads .env.local
 
-load_dotenv(dotenv_path=".env.local")
 logger = logging.getLogger("interview-agent")
 
 class InterviewAgent(Agent):
@@ -74,9 +72,11 @@ class InterviewAgent(Agent):
         """Initialize RAG and workflow systems."""
         logger.info("Initializing RAG and workflow systems...")
         try:
-            self.rag_system = initialize_rag_system()
-            self.interview_workflow = create_interview_workflow(
-                self.rag_system
+            # Both load models and call out to the network; run them in worker
+            # threads so the event loop keeps serving the LiveKit session
+            self.rag_system = await asyncio.to_thread(initialize_rag_system)
+            self.interview_workflow = await asyncio.to_thread(
+                create_interview_workflow, self.rag_system
             )
             logger.info("Systems initialized successfully")
         except Exception as e:
@@ -137,26 +137,37 @@ class InterviewAgent(Agent):
         
         return "Let me think of the next question..."
     
-    async def save_interview_session_to_db(self, status: str = "in_progress"):
-        """Save interview session to PostgreSQL database."""
-        if not self.rag_system or not self.interview_state:
-            return
+    def _interview_data(self, status: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Collect the interview_sessions columns for the current interview; now is the end time if completed.
         
+        The resume, job description and plan are fixed once planning is done, so
+        they are left out after the session row has been saved.
+        """
         interview_data = {
             "interview_id": self.interview_id,
             "candidate_name": self.candidate_name,
             "start_time": self.interview_start_time,
-            "end_time": datetime.now() if status == "completed" else None,
+            "end_time": (now or datetime.now()) if status == "completed" else None,
             "status": status,
-            "resume_content": self.interview_state.get("resume_content"),
-            "job_description": self.interview_state.get("job_description"),
-            "interview_plan": self.interview_state.get("interview_plan"),
             "questions_and_answers": self.interview_state.get("questions_list"),
             "interview_summary": self.interview_state.get("interview_summary"),
             "transcription": self.interview_state.get("conversation_history")
         }
+        if not self.session_id:
+            interview_data["resume_content"] = self.interview_state.get("resume_content")
+            interview_data["job_description"] = self.interview_state.get("job_description")
+            interview_data["interview_plan"] = self.interview_state.get("interview_plan")
+        return interview_data
+    
+    async def save_interview_session_to_db(self, status: str = "in_progress"):
+        """Save interview session to PostgreSQL database."""
+        if not self.rag_system or not self.interview_state:
+            return
+        
+        interview_data = self._interview_data(status)
         
-        self.session_id = self.rag_system.save_interview_session(interview_data)
+        # The database driver is synchronous; keep it off the event loop
+        self.session_id = await asyncio.to_thread(self.rag_system.save_interview_session, interview_data)
         if self.session_id:
             logger.info(f"Interview session saved to database with ID: {self.session_id}")
     
@@ -164,26 +175,38 @@ class InterviewAgent(Agent):
         """Save final interview results to database."""
         logger.info("Saving interview results...")
         
+        if not self.rag_system or not self.interview_state:
+            return
+        
         try:
-            # Update interview session with completion status
-            await self.save_interview_session_to_db(status="completed")
+            # One timestamp for both the session end time and the duration
+            now = datetime.now()
             
-            # Calculate and save interview metrics
-            if self.interview_workflow and self.interview_state:
-                metrics_data = self.interview_workflow.get_interview_metrics(self.interview_state)
-                
-                # Add duration calculation
+            # Calculate interview metrics
+            metrics_data = None
+            if self.interview_workflow:
+                duration = None
                 if self.interview_start_time:
-                    duration = (datetime.now() - self.interview_start_time).total_seconds() / 60
-                    metrics_data["total_duration_minutes"] = duration
-                
-                # Add token usage
-                metrics_data["total_tokens_used"] = self.total_tokens_used
+                    duration = (now - self.interview_start_time).total_seconds() / 60
                 
-                # Save metrics to database
-                metrics_id = self.rag_system.save_interview_metrics(self.interview_id, metrics_data)
-                if metrics_id:
-                    logger.info(f"Interview metrics saved with ID: {metrics_id}")
+                # Add duration and token usage to the workflow's metrics
+                metrics_data = {
+                    **self.interview_workflow.get_interview_metrics(self.interview_state),
+                    "total_duration_minutes": duration,
+                    "total_tokens_used": self.total_tokens_used,
+                }
+            
+            # Mark the session completed and save its metrics in one transaction
+            session_id, metrics_id = await asyncio.to_thread(
+                self.rag_system.save_interview_results,
+                self._interview_data("completed", now),
+                metrics_data,
+            )
+            if session_id:
+                self.session_id = session_id
+                logger.info(f"Interview session saved to database with ID: {session_id}")
+            if metrics_id:
+                logger.info(f"Interview metrics saved with ID: {metrics_id}")
             
             logger.info(f"Interview results saved successfully. Total tokens used: {self.total_tokens_used}")
             
@@ -257,11 +280,13 @@ class InterviewAgent(Agent):
     
     async def on_user_speech(self, user_speech):
         """Handle user speech input from LiveKit."""
-        logger.info(f"Received candidate speech: {user_speech.alternatives[0].text[:100] if user_speech.alternatives else 'No text'}...")
+        alternatives = user_speech.alternatives
+        # %-style args are only formatted (and truncated) if INFO is enabled
+        logger.info("Received candidate speech: %.100s...", alternatives[0].text if alternatives else "No text")
         
         try:
             # Get the transcribed text
-            response_text = user_speech.alternatives[0].text if user_speech.alternatives else ""
+            response_text = alternatives[0].text if alternatives else ""
             
             if response_text.strip():
                 # Process the response and get next question
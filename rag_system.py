@@ -6,18 +6,19 @@ Handles storage and retrieval of resumes, job descriptions, and question banks.
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import chromadb
 from chromadb.config import Settings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_openai import OpenAIEmbeddings
 import numpy as np
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
 import uuid
 
 load_dotenv()
@@ -77,6 +78,13 @@ class InterviewMetrics(Base):
 class InterviewRAG:
     """Enhanced RAG system for interview-related data with PostgreSQL integration."""
     
+    # Session columns an upsert may overwrite; interview_id is the conflict key
+    SESSION_FIELDS = (
+        "candidate_name", "start_time", "end_time", "status", "resume_content",
+        "job_description", "interview_plan", "questions_and_answers",
+        "interview_summary", "transcription",
+    )
+    
     def __init__(self, persist_directory: str = "./chroma_db", postgres_url: Optional[str] = None):
         """Initialize the RAG system with ChromaDB and PostgreSQL."""
         self.persist_directory = persist_directory
@@ -126,7 +134,13 @@ class InterviewRAG:
     def _setup_database(self):
         """Setup PostgreSQL database connection and create tables."""
         try:
-            self.engine = create_engine(self.postgres_url, echo=False)
+            # Encode and decode the JSON columns (plan, Q&A, transcript) with orjson
+            self.engine = create_engine(
+                self.postgres_url,
+                echo=False,
+                json_serializer=lambda value: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode(),
+                json_deserializer=orjson.loads,
+            )
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
             
             # Create tables
@@ -449,34 +463,56 @@ class InterviewRAG:
             for doc, meta in zip(results['documents'], results['metadatas'])
         ]
     
+    def _upsert_session(self, db: Session, interview_data: Dict[str, Any]) -> str:
+        """Insert or update the interview_sessions row for interview_data in one statement.
+        
+        Only the fields present in interview_data are written, so an update can
+        leave columns that have not changed out of the statement entirely.
+        """
+        values = {field: interview_data[field] for field in self.SESSION_FIELDS if field in interview_data}
+        values["status"] = interview_data.get("status", "completed")
+        stmt = pg_insert(InterviewSession).values(
+            id=uuid.uuid4(), interview_id=interview_data.get("interview_id"), **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[InterviewSession.interview_id],
+            set_={**values, "updated_at": datetime.utcnow()},
+        ).returning(InterviewSession.id)
+        return str(db.execute(stmt).scalar_one())
+    
+    def _add_metrics(self, db: Session, interview_id: str, metrics: Dict[str, Any]) -> str:
+        """Stage an interview_metrics row and return its ID."""
+        metrics_record = InterviewMetrics(
+            id=uuid.uuid4(),
+            interview_id=interview_id,
+            total_questions=metrics.get("total_questions"),
+            questions_answered=metrics.get("questions_answered"),
+            follow_up_questions=metrics.get("follow_up_questions"),
+            total_duration_minutes=metrics.get("total_duration_minutes"),
+            avg_completeness_score=metrics.get("avg_completeness_score"),
+            avg_clarity_score=metrics.get("avg_clarity_score"),
+            avg_technical_depth_score=metrics.get("avg_technical_depth_score"),
+            avg_relevance_score=metrics.get("avg_relevance_score"),
+            total_tokens_used=metrics.get("total_tokens_used"),
+            prompt_tokens=metrics.get("prompt_tokens"),
+            completion_tokens=metrics.get("completion_tokens")
+        )
+        db.add(metrics_record)
+        return str(metrics_record.id)
+    
     def save_interview_session(self, interview_data: Dict[str, Any]) -> Optional[str]:
-        """Save interview session to PostgreSQL."""
+        """Save interview session to PostgreSQL, updating it if interview_id already exists."""
         db = self.get_db_session()
         if not db:
             logger.warning("Database not available. Skipping interview save.")
             return None
         
         try:
-            session = InterviewSession(
-                interview_id=interview_data.get("interview_id"),
-                candidate_name=interview_data.get("candidate_name"),
-                start_time=interview_data.get("start_time"),
-                end_time=interview_data.get("end_time"),
-                status=interview_data.get("status", "completed"),
-                resume_content=interview_data.get("resume_content"),
-                job_description=interview_data.get("job_description"),
-                interview_plan=interview_data.get("interview_plan"),
-                questions_and_answers=interview_data.get("questions_and_answers"),
-                interview_summary=interview_data.get("interview_summary"),
-                transcription=interview_data.get("transcription")
-            )
-            
-            db.add(session)
+            session_id = self._upsert_session(db, interview_data)
             db.commit()
-            db.refresh(session)
             
-            logger.info(f"Interview session saved with ID: {session.id}")
-            return str(session.id)
+            logger.info(f"Interview session saved with ID: {session_id}")
+            return session_id
             
         except Exception as e:
             logger.error(f"Failed to save interview session: {e}")
@@ -492,26 +528,10 @@ class InterviewRAG:
             return None
         
         try:
-            metrics_record = InterviewMetrics(
-                interview_id=interview_id,
-                total_questions=metrics.get("total_questions"),
-                questions_answered=metrics.get("questions_answered"),
-                follow_up_questions=metrics.get("follow_up_questions"),
-                total_duration_minutes=metrics.get("total_duration_minutes"),
-                avg_completeness_score=metrics.get("avg_completeness_score"),
-                avg_clarity_score=metrics.get("avg_clarity_score"),
-                avg_technical_depth_score=metrics.get("avg_technical_depth_score"),
-                avg_relevance_score=metrics.get("avg_relevance_score"),
-                total_tokens_used=metrics.get("total_tokens_used"),
-                prompt_tokens=metrics.get("prompt_tokens"),
-                completion_tokens=metrics.get("completion_tokens")
-            )
-            
-            db.add(metrics_record)
+            metrics_id = self._add_metrics(db, interview_id, metrics)
             db.commit()
-            db.refresh(metrics_record)
             
-            return str(metrics_record.id)
+            return metrics_id
             
         except Exception as e:
             logger.error(f"Failed to save interview metrics: {e}")
@@ -519,6 +539,33 @@ class InterviewRAG:
             return None
         finally:
             db.close()
+    
+    def save_interview_results(self, interview_data: Dict[str, Any], metrics: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Upsert the final session and insert its metrics in a single transaction.
+        
+        Returns (session_id, metrics_id); both are None if the save failed.
+        """
+        db = self.get_db_session()
+        if not db:
+            logger.warning("Database not available. Skipping interview save.")
+            return None, None
+        
+        try:
+            session_id = self._upsert_session(db, interview_data)
+            metrics_id = None
+            if metrics is not None:
+                metrics_id = self._add_metrics(db, interview_data.get("interview_id"), metrics)
+            db.commit()
+            
+            logger.info(f"Interview session saved with ID: {session_id}")
+            return session_id, metrics_id
+            
+        except Exception as e:
+            logger.error(f"Failed to save interview results: {e}")
+            db.rollback()
+            return None, None
+        finally:
+            db.close()
 
 def initialize_rag_system() -> InterviewRAG:
     """Initialize and populate the RAG system."""
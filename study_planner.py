@@ -47,11 +47,10 @@ class InterviewStudyPlanner:
             config = get_openai_config()
 
             # Override model name if provided
-            if model_name != "gpt-4o":
-                config.model_name = model_name
+            model = model_name if model_name != "gpt-4o" else None
 
             # Initialize ChatOpenAI with configuration
-            self.llm = ChatOpenAI(**config.get_chatgpt_config())
+            self.llm = ChatOpenAI(**config.get_chatgpt_config(model=model))
             self.graph = self._build_graph()
         else:
             # Initialize fast mode patterns